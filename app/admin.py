@@ -2,56 +2,143 @@
 Handles administrator privilege requests
 """
 
-import ctypes
+import functools
+import os
+import subprocess
 import sys
 
-from pathlib import Path
+from contextlib import contextmanager
+from typing import Optional
 from app.logger import get_logger
 
 logger = get_logger()
 
+# Relaunch target is fixed for the process lifetime, so resolve it once
+_EXE_PATH = sys.executable
+# list2cmdline applies the CommandLineToArgvW quoting rules
+if getattr(sys, "frozen", False):
+    # Running as PyInstaller executable
+    _PROJECT_ROOT = None
+    _PARAMS = subprocess.list2cmdline(sys.argv[1:])
+else:
+    # Running from source: use -m app.main to preserve package structure
+    _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    _PARAMS = "-m app.main " + subprocess.list2cmdline(sys.argv[1:])
+
+
+def _not_admin() -> bool:
+    return False
+
+
+def _resolve_is_admin_impl():
+    """Pick the elevation check for this platform, binding Win32 APIs on Windows"""
+    if sys.platform != "win32":
+        return _not_admin
+
+    # Deferred so ctypes is only loaded when an elevation check is needed
+    from app import winapi
+
+    try:
+        token = winapi.open_identification_token()
+        sid = winapi.allocate_admin_sid()
+    except OSError as e:
+        logger.warning(f"Could not query process token, assuming not elevated: {e}")
+        return _not_admin
+    return functools.partial(winapi.check_token_membership, token, sid)
+
+
+_is_admin_impl = None
+
+
+class ElevationRequested(Exception):
+    """Raised after an elevated instance was launched; the caller should exit"""
+
+    def __init__(self, process: int):
+        super().__init__("Relaunched with administrator privileges")
+        self.process = process  # Handle of the elevated child process
+
+
+@functools.lru_cache(maxsize=1)
+def is_admin() -> bool:
+    """Check if running with administrator privileges"""
+    global _is_admin_impl
+    if _is_admin_impl is None:
+        _is_admin_impl = _resolve_is_admin_impl()
+    # Elevation cannot change during the process lifetime, so check it once
+    return _is_admin_impl()
+
+
+@contextmanager
+def require_admin():
+    """Guard a privileged operation, relaunching elevated on first use"""
+    if not is_admin():
+        logger.info("Requesting administrator privileges...")
+        process = request_admin()
+        if process is not None:
+            raise ElevationRequested(process)
+        raise PermissionError("Administrator privileges required but not granted")
+    yield
+
+
+def request_admin() -> Optional[int]:
+    """
+    Request administrator privileges by restarting with UAC prompt
+
+    Returns:
+        Handle of the relaunched process (release it with wait_for_exit),
+        or None if the relaunch failed
+    """
+    if sys.platform != "win32":
+        logger.error("Administrator elevation is only supported on Windows")
+        return None
+
+    from app import winapi
+
+    try:
+        return winapi.relaunch_elevated(_EXE_PATH, _PARAMS, _PROJECT_ROOT)
+
+    except Exception as e:
+        logger.error(f"Failed to request admin privileges: {e}")
+        return None
+
+
+def wait_for_exit(process: int, timeout: Optional[float] = None) -> bool:
+    """
+    Block until a process returned by request_admin exits, then close it
+
+    Args:
+        process: Process handle from request_admin
+        timeout: Seconds to wait, or None to wait indefinitely
+
+    Returns:
+        True if the process exited within the timeout
+    """
+    from app import winapi
+
+    timeout_ms = winapi.INFINITE if timeout is None else int(timeout * 1000)
+    try:
+        return winapi.wait_for_handle(process, timeout_ms)
+    finally:
+        winapi.close_handle(process)
+
 
 class AdminManager:
-    """Manages administrator privilege requests"""
+    """Backwards-compatible wrapper around the module-level admin functions"""
 
-    def is_admin(self) -> bool:
+    def is_admin(self, use_cache: bool = True) -> bool:
         """Check if running with administrator privileges"""
-        try:
-            return ctypes.windll.shell32.IsUserAnAdmin()
-        except Exception:
-            return False
+        if not use_cache:
+            is_admin.cache_clear()
+        return is_admin()
+
+    def require_admin(self):
+        """Guard a privileged operation, relaunching elevated on first use"""
+        return require_admin()
 
-    def request_admin(self) -> bool:
+    def request_admin(self) -> Optional[int]:
         """Request administrator privileges by restarting with UAC prompt"""
-        try:
-            # Get the current executable path
-            if getattr(sys, "frozen", False):
-                # Running as PyInstaller executable
-                exe_path = sys.executable
-                params = " ".join([f'"{arg}"' for arg in sys.argv[1:]])
-            else:
-                # Running as Python script from source
-                exe_path = sys.executable
-                project_root = Path(__file__).parent.parent
-
-                # Use -m app.main to preserve package structure
-                args = " ".join([f'"{arg}"' for arg in sys.argv[1:]])
-                params = f"-m app.main {args}"
-
-            # Request admin privileges
-            ctypes.windll.shell32.ShellExecuteW(
-                None,  # hwnd
-                "runas",  # operation
-                exe_path,  # file
-                params,  # parameters
-                (
-                    str(project_root) if not getattr(sys, "frozen", False) else None
-                ),  # directory
-                1,  # show command (SW_SHOWNORMAL)
-            )
-
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to request admin privileges: {e}")
-            return False
+        return request_admin()
+
+    def wait_for_exit(self, process: int, timeout: Optional[float] = None) -> bool:
+        """Block until a relaunched process exits, then close its handle"""
+        return wait_for_exit(process, timeout)
@@ -229,6 +229,38 @@ class ConfigMigrator:
 
         return True
 
+    def validate_backup_settings(self, config_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Reset BACKUP settings SQL Server would reject to their defaults"""
+        validated = config_data.copy()
+
+        # field: (check, default); 0 means "use the built-in value"
+        rules = {
+            "backup_max_transfer_size": (
+                lambda v: v == 0 or (0 < v <= 4194304 and v % 65536 == 0),
+                0,
+            ),
+            "backup_buffer_count": (lambda v: v == 0 or v >= 1, 0),
+            "backup_stripes": (lambda v: 1 <= v <= 64, 1),
+        }
+
+        for field, (check, default) in rules.items():
+            if field not in validated:
+                continue
+            try:
+                value = int(validated[field])
+                valid = check(value)
+            except (TypeError, ValueError):
+                valid = False
+            if valid:
+                validated[field] = value
+            else:
+                logger.warning(
+                    f"Invalid {field}: {validated[field]!r}, using default {default}"
+                )
+                validated[field] = default
+
+        return validated
+
     def repair_config(self, config_data: Dict[str, Any]) -> Dict[str, Any]:
         """Attempt to repair corrupted configuration"""
         repaired = config_data.copy()
@@ -300,6 +332,9 @@ class ConfigManager:
                     with open(self.config_file, "w") as f:
                         json.dump(data, f, indent=2)
 
+                # Values SQL Server rejects would fail every backup
+                data = self.migrator.validate_backup_settings(data)
+
                 # Decrypt sensitive fields
                 data = self.crypto.decrypt_dict(data)
 
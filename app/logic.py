@@ -2,21 +2,121 @@
 Executes batch-equivalent commands with proper error handling and timeouts
 """
 
+import asyncio
+import functools
 import subprocess
 import os
+import queue
+import re
 import shutil
+import stat
+import sys
+import tempfile
+import threading
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from typing import List, Tuple, Dict, Optional
+from typing import Callable, List, Tuple, Dict, Optional
 from datetime import datetime
 from PySide6.QtCore import QObject, Signal
 
+try:
+    import winreg
+except ImportError:  # Not on Windows
+    winreg = None
+
 from app.logger import get_logger
+from app.sqlcmd_session import SqlcmdPool
 from app.models import OperationResult, Resource, ResourceType, OperationStatus
 
 logger = get_logger()
 
+# "-P <password>" arguments in logged command lines
+_PASSWORD_ARG_RE = re.compile(r"(-P\s+)([^\s]+)")
+
+# 32-bit uninstall entries, where the RMS_* installers register themselves
+_UNINSTALL_KEY = r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"
+
+
+@functools.lru_cache(maxsize=4)
+def _read_text_cached(path: str, mtime: float) -> str:
+    """Read a small text file; mtime is part of the cache key so edits are picked up"""
+    with open(path, "r") as f:
+        return f.read()
+
+
+# Striped backup file name, e.g. "RmsBranchSrv_2of4.bak"
+_STRIPE_RE = re.compile(r"^(.*)_(\d+)of(\d+)\.bak$", re.IGNORECASE)
+
+
+def _stripe_paths(backup_path: str, stripes: int) -> List[str]:
+    """File names for a backup written as a stripe set (one file if stripes <= 1)"""
+    if stripes <= 1:
+        return [backup_path]
+    base = backup_path[:-4] if backup_path.lower().endswith(".bak") else backup_path
+    return [f"{base}_{i}of{stripes}.bak" for i in range(1, stripes + 1)]
+
+
+def _stripe_set(backup_file: str) -> List[str]:
+    """All files of the stripe set backup_file belongs to (just itself if none)"""
+    match = _STRIPE_RE.match(backup_file)
+    if match:
+        paths = _stripe_paths(f"{match.group(1)}.bak", int(match.group(3)))
+        if all(os.path.isfile(path) for path in paths):
+            return paths
+    return [backup_file]
+
+
+def _disk_clause(paths: List[str]) -> str:
+    """T-SQL backup device list: DISK = N'...', DISK = N'...'"""
+    return ", ".join("DISK = N'{}'".format(path.replace("'", "''")) for path in paths)
+
+
+@functools.lru_cache(maxsize=None)
+def _exe(name: str) -> str:
+    """Full path of a console tool, resolved once instead of on every spawn"""
+    return shutil.which(name) or name
+
+
+def _is_link_stat(st: os.stat_result) -> bool:
+    """Symlink, junction or mount point, given an lstat() result"""
+    # Junctions are not S_ISLNK before 3.12, only reparse points
+    attributes = getattr(st, "st_file_attributes", 0)
+    return stat.S_ISLNK(st.st_mode) or bool(
+        attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _api_base(base_url: str) -> str:
+    """Normalise the configured API base URL to end in exactly one slash"""
+    return base_url.rstrip("/") + "/"
+
+
+def _operation(method):
+    """Pin SQL credentials while a top-level operation runs, then flush its logs"""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # Thread-local, so other callers (e.g. the UI thread) never see it
+        previous = getattr(self._op_local, "sql_credentials", None)
+        self._op_local.sql_credentials = (
+            self.config.get("sql_instance"),
+            self.config.get("sql_user"),
+            self.config.get("sql_password"),
+        )
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._op_local.sql_credentials = previous
+            self.flush_logs()
+
+    return wrapper
+
 
 class BatchRunner(QObject):
     """Executes commands equivalent to the original batch files"""
@@ -29,13 +129,170 @@ class BatchRunner(QObject):
     SERVICE_TIMEOUT = 60  # 1 minute for service operations
     SQL_TIMEOUT = 600  # 10 minutes for database operations
 
+    # Log batching: max wait for more lines, and max bytes per logger call
+    LOG_FLUSH_INTERVAL = 0.02
+    LOG_BATCH_BYTES = 64 * 1024
+
+    # BACKUP DATABASE I/O tuning (used when the backup_tuning setting is on)
+    BACKUP_MAX_TRANSFER_SIZE = 4 * 1024 * 1024
+    BACKUP_BUFFER_COUNT = 16
+    BACKUP_KEYS = ("backup_tuning", "backup_max_transfer_size", "backup_buffer_count")
+
+    # Free space (MB) below which DBCC SHRINKDATABASE is skipped
+    SHRINK_MIN_FREE_MB = 64
+
+    # Chunk size for streaming large files
+    COPY_BUFFER_SIZE = 1024 * 1024
+
+    # Archive members deflated at the highest level (small text configs)
+    TEXT_SUFFIXES = (".json", ".config", ".xml", ".txt")
+
+    # Concurrent file deletions when removing folders (I/O bound)
+    DELETE_WORKERS = 16
+
+    # Concurrent sqlcmd sessions kept open against the instance
+    SQLCMD_POOL_SIZE = 4
+
+    # Longest query passed inline with -Q before switching to an input file
+    MAX_INLINE_QUERY = 30000
+
+    # Upper bound for concurrent per-resource cleanup work
+    MAX_PARALLEL_WORKERS = 8
+
     def __init__(self, config_manager):
         super().__init__()
         self.config = config_manager
+        self._session: Optional[requests.Session] = None
+
+        # Log lines are handed to a background writer in batches
+        self._log_q: queue.Queue = queue.Queue(maxsize=10000)
+        self._log_thread = threading.Thread(
+            target=self._log_worker, daemon=True, name="BatchRunnerLog"
+        )
+        self._log_thread.start()
+
+        # Per-thread (instance, user, password) snapshot of the running
+        # operation; _run_parallel hands it on to its workers
+        self._op_local = threading.local()
+
+        # Pool of persistent sqlcmd sessions (see sqlcmd())
+        self._sqlcmd_pool: Optional[SqlcmdPool] = None
+        self._sqlcmd_key: Optional[Tuple[str, str, str]] = None
+        self._sqlcmd_lock = threading.Lock()
+
+        # Server default DATA/LOG paths per SQL instance (see get_sql_paths())
+        self._sql_paths_cache: Dict[str, Tuple[str, str]] = {}
+
+    def _get_session(self) -> requests.Session:
+        """Shared HTTP session so repeated RMS API calls reuse keep-alive connections"""
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=8,
+                # Only idempotent GETs are retried: the uninstall PUTs may have
+                # been applied before a gateway error. After the last retry the
+                # real response is returned so callers can report its status.
+                max_retries=Retry(
+                    total=2,
+                    backoff_factor=0.2,
+                    status_forcelist=[502, 503, 504],
+                    allowed_methods=frozenset({"GET"}),
+                    raise_on_status=False,
+                ),
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({"Accept": "application/json"})
+            self._session = session
+        return self._session
+
+    def _snapshot_config(self, *keys: str) -> SimpleNamespace:
+        """Read the given settings once for use throughout an operation"""
+        return SimpleNamespace(**{key: self.config.get(key) for key in keys})
+
+    def _in_operation(self, func: Callable) -> Callable:
+        """Wrap func so worker threads use the calling thread's SQL snapshot"""
+        credentials = getattr(self._op_local, "sql_credentials", None)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            previous = getattr(self._op_local, "sql_credentials", None)
+            self._op_local.sql_credentials = credentials
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._op_local.sql_credentials = previous
+
+        return wrapper
+
+    def _sql_credentials(self) -> Tuple[str, str, str]:
+        """SQL (instance, user, password), from the operation snapshot if active"""
+        credentials = getattr(self._op_local, "sql_credentials", None)
+        if credentials is not None:
+            return credentials
+        return (
+            self.config.get("sql_instance"),
+            self.config.get("sql_user"),
+            self.config.get("sql_password"),
+        )
 
     # Log output and send to signal
-    def _log_output(self, message: str, is_error: bool = False):
-        self.log_message.emit(message, is_error)
+    def _log_output(self, message: str, is_error: bool = False, ui: bool = True):
+        """Queue a log line; ui=False keeps it out of the UI (file log only)"""
+        try:
+            self._log_q.put_nowait((message, is_error, ui))
+        except queue.Full:
+            # Writer is saturated: deliver synchronously rather than drop
+            self._write_logs([(message, is_error, ui)])
+
+    def flush_logs(self):
+        """Block until all queued log lines have been written"""
+        self._log_q.join()
+
+    def _log_worker(self):
+        """Drain queued log lines, writing them to the logger in batches"""
+        while True:
+            batch = [self._log_q.get()]
+            size = len(batch[0][0])
+            try:
+                while size < self.LOG_BATCH_BYTES:
+                    item = self._log_q.get(timeout=self.LOG_FLUSH_INTERVAL)
+                    batch.append(item)
+                    size += len(item[0])
+            except queue.Empty:
+                pass
+
+            try:
+                self._write_logs(batch)
+            except Exception:
+                pass  # Logging must never take down the writer thread
+            finally:
+                for _ in batch:
+                    self._log_q.task_done()
+
+    def _write_logs(self, batch: List[Tuple[str, bool, bool]]):
+        """Write a batch: one UI emit and one logger call per same-level run"""
+        ui_lines = [(message, is_error) for message, is_error, ui in batch if ui]
+        self._write_runs(ui_lines, self.log_message.emit)
+        self._write_runs([item[:2] for item in batch], self._write_log_run)
+
+    @staticmethod
+    def _write_runs(lines: List[Tuple[str, bool]], write: Callable[[str, bool], None]):
+        """Join consecutive lines of the same level and hand each run to write"""
+        run: List[str] = []
+        run_is_error = False
+        for message, is_error in lines:
+            if run and is_error != run_is_error:
+                write("\n".join(run), run_is_error)
+                run = []
+            run.append(message)
+            run_is_error = is_error
+        if run:
+            write("\n".join(run), run_is_error)
+
+    @staticmethod
+    def _write_log_run(message: str, is_error: bool):
         if is_error:
             logger.error(message)
         else:
@@ -48,6 +305,35 @@ class BatchRunner(QObject):
         timeout: Optional[int] = COMMAND_TIMEOUT,
     ) -> Tuple[int, str, str]:
         """Execute a command with timeout and return results"""
+        return asyncio.run(self.run_command_async(command, shell, timeout))
+
+    def run_commands_batch(
+        self,
+        commands: List[List[str]],
+        timeout: Optional[int] = COMMAND_TIMEOUT,
+    ) -> List[Tuple[int, str, str]]:
+        """Execute independent commands concurrently, results in input order"""
+
+        async def run_all():
+            return await asyncio.gather(
+                *[self.run_command_async(cmd, timeout=timeout) for cmd in commands]
+            )
+
+        return asyncio.run(run_all())
+
+    async def run_command_async(
+        self,
+        command: List[str],
+        shell: bool = False,
+        timeout: Optional[int] = COMMAND_TIMEOUT,
+        line_cb: Optional[Callable[[str], None]] = None,
+    ) -> Tuple[int, str, str]:
+        """
+        Execute a command on the event loop with timeout and return results
+
+        With line_cb, each stdout line is handed over as it arrives (while
+        stderr is drained concurrently) and the returned stdout is empty.
+        """
         try:
             # Mask sensitive data in command for logging
             log_command = self._mask_sensitive_data(" ".join(command))
@@ -55,34 +341,48 @@ class BatchRunner(QObject):
 
             start_time = time.time()
 
-            result = subprocess.run(
-                command,
-                shell=shell,
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                timeout=timeout,
-                creationflags=0x08000000,  # CREATE_NO_WINDOW
-            )
+            spawn_kwargs = {
+                # Nothing we run reads input; a prompt (e.g. net stop asking to
+                # stop dependent services) gets EOF instead of hanging to timeout
+                "stdin": asyncio.subprocess.DEVNULL,
+                "stdout": asyncio.subprocess.PIPE,
+                "stderr": asyncio.subprocess.PIPE,
+                "creationflags": 0x08000000,  # CREATE_NO_WINDOW
+            }
+            if shell:
+                proc = await asyncio.create_subprocess_shell(
+                    subprocess.list2cmdline(command), **spawn_kwargs
+                )
+            else:
+                proc = await asyncio.create_subprocess_exec(*command, **spawn_kwargs)
 
-            duration = time.time() - start_time
-            logger.info(
-                f"Command completed in {duration:.2f}s with return code: {result.returncode}"
-            )
+            async def stream() -> Tuple[bytes, bytes]:
+                async def pump():
+                    async for raw in proc.stdout:
+                        line_cb(raw.decode("utf-8", errors="replace"))
 
-            if result.stdout:
-                # Mask sensitive data in output
-                safe_output = self._mask_sensitive_data(result.stdout)
-                self._log_output(safe_output)
-            if result.stderr:
-                safe_stderr = self._mask_sensitive_data(result.stderr)
-                self._log_output(safe_stderr, is_error=True)
+                _, err = await asyncio.gather(pump(), proc.stderr.read())
+                await proc.wait()
+                return b"", err
 
-            return result.returncode, result.stdout, result.stderr
+            try:
+                out, err = await asyncio.wait_for(
+                    proc.communicate() if line_cb is None else stream(), timeout
+                )
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise
+
+            stdout = out.decode("utf-8", errors="replace")
+            stderr = err.decode("utf-8", errors="replace")
+            self._log_command_result(
+                time.time() - start_time, proc.returncode, stdout, stderr
+            )
+            return proc.returncode, stdout, stderr
 
-        except subprocess.TimeoutExpired as e:
-            error_msg = f"Command timed out after {timeout}s: {e}"
+        except asyncio.TimeoutError:
+            error_msg = f"Command timed out after {timeout}s"
             self._log_output(error_msg, is_error=True)
             return 1, "", error_msg
         except Exception as e:
@@ -90,35 +390,71 @@ class BatchRunner(QObject):
             self._log_output(error_msg, is_error=True)
             return 1, "", error_msg
 
+    def run_command_stream(
+        self,
+        command: List[str],
+        line_cb: Callable[[str], None],
+        timeout: Optional[int] = COMMAND_TIMEOUT,
+    ) -> Tuple[int, str]:
+        """
+        Execute a command and hand each stdout line to line_cb as it arrives
+
+        Returns:
+            (returncode, stderr)
+        """
+        returncode, _, stderr = asyncio.run(
+            self.run_command_async(command, timeout=timeout, line_cb=line_cb)
+        )
+        return returncode, stderr
+
+    def _log_command_result(
+        self, duration: float, returncode: int, stdout: str, stderr: str
+    ):
+        """Log a finished command's timing and masked output"""
+        # Queued like all other lines so the file log keeps its order
+        self._log_output(
+            f"Command completed in {duration:.2f}s with return code: {returncode}",
+            ui=False,
+        )
+
+        if stdout:
+            # Commands never echo their -P argument, so stdout only needs the
+            # literal password check (a password pasted into a query)
+            self._log_output(self._mask_password(stdout))
+        if stderr:
+            safe_stderr = self._mask_sensitive_data(stderr)
+            self._log_output(safe_stderr, is_error=True)
+
     def _mask_sensitive_data(self, text: str) -> str:
         """Mask passwords and other sensitive data in log output"""
         if not text:
             return text
 
-        # Get SQL password for masking
-        sql_password = self.config.get("sql_password")
-        if sql_password and len(sql_password) > 3:
-            # Replace password with asterisks
-            text = text.replace(sql_password, "***")
-
-        # Also mask common password patterns in commands
-        import re
+        text = self._mask_password(text)
 
         # Mask -P password arguments
-        text = re.sub(r"(-P\s+)([^\s]+)", r"\1***", text)
+        if "-P" in text:
+            text = _PASSWORD_ARG_RE.sub(r"\1***", text)
 
         return text
 
+    def _mask_password(self, text: str) -> str:
+        """Replace the configured SQL password with asterisks"""
+        sql_password = self._sql_credentials()[2]
+        if sql_password and len(sql_password) > 3 and sql_password in text:
+            return text.replace(sql_password, "***")
+        return text
+
     def get_release_number(self) -> str:
         """Read the RMS+ POS Release Number from the local filesystem"""
         release_path_str = self.config.get(
             "release_path", r"C:\ProgramData\RMS_Plus\ReleaseNumber.txt"
         )
-        release_path = Path(release_path_str)
         try:
-            if release_path.exists():
-                with open(release_path, "r") as f:
-                    return f.read().strip()
+            # One stat per refresh; the file is only re-read when it changes
+            mtime = os.stat(release_path_str).st_mtime
+            return _read_text_cached(release_path_str, mtime).strip()
+        except FileNotFoundError:
             return "N/A"
         except Exception as e:
             logger.error(f"Failed to read release number: {e}")
@@ -127,21 +463,73 @@ class BatchRunner(QObject):
     def sqlcmd(
         self, query: str, database: str = "master", timeout: Optional[int] = None
     ) -> Tuple[int, str, str]:
-        """Execute SQL query using sqlcmd with timeout"""
+        """Execute SQL query over the persistent sqlcmd session with timeout"""
         if timeout is None:
             timeout = self.SQL_TIMEOUT
 
-        sql_instance = self.config.get("sql_instance")
-        sql_user = self.config.get("sql_user")
-        sql_password = self.config.get("sql_password")
+        key = self._sql_credentials()
 
         # Validate we have credentials
-        if not sql_password:
+        if not key[2]:
             logger.error("SQL password not available")
             return 1, "", "SQL password not configured"
 
+        self._log_output(
+            f"Executing (sqlcmd session, {database}): "
+            f"{self._mask_sensitive_data(query.strip())}"
+        )
+        start_time = time.time()
+
+        try:
+            returncode, stdout, stderr = self._get_sqlcmd_pool(key).query(
+                query, database, timeout
+            )
+        except subprocess.TimeoutExpired:
+            error_msg = f"Command timed out after {timeout}s"
+            self._log_output(error_msg, is_error=True)
+            return 1, "", error_msg
+        except OSError as e:
+            # Session could not start or take the script, so nothing ran yet:
+            # safe to retry in a one-shot process
+            logger.warning(f"sqlcmd session unavailable, using one-shot: {e}")
+            return self._sqlcmd_oneshot(query, database, timeout, key)
+
+        self._log_command_result(time.time() - start_time, returncode, stdout, stderr)
+        return returncode, stdout, stderr
+
+    def sqlcmd_batch(
+        self,
+        statements: List[str],
+        database: str = "master",
+        timeout: Optional[int] = None,
+    ) -> Tuple[int, str, str]:
+        """Execute several SQL batches in a single round trip, separated by GO"""
+        return self.sqlcmd("\nGO\n".join(statements), database, timeout)
+
+    def _get_sqlcmd_pool(self, key: Tuple[str, str, str]) -> SqlcmdPool:
+        """Return the session pool, rebuilding it if credentials changed"""
+        with self._sqlcmd_lock:
+            if self._sqlcmd_pool is None or self._sqlcmd_key != key:
+                if self._sqlcmd_pool is not None:
+                    self._sqlcmd_pool.close()
+                self._log_output(f"Starting sqlcmd session pool for: {key[0]}")
+                self._sqlcmd_pool = SqlcmdPool(
+                    *key, size=self.SQLCMD_POOL_SIZE, executable=_exe("sqlcmd")
+                )
+                self._sqlcmd_key = key
+            return self._sqlcmd_pool
+
+    def _sqlcmd_oneshot(
+        self,
+        query: str,
+        database: str,
+        timeout: int,
+        key: Tuple[str, str, str],
+    ) -> Tuple[int, str, str]:
+        """Execute SQL query in a dedicated sqlcmd process"""
+        sql_instance, sql_user, sql_password = key
         cmd = [
-            "sqlcmd",
+            _exe("sqlcmd"),
             "-S",
             sql_instance,
             "-U",
@@ -150,8 +538,6 @@ class BatchRunner(QObject):
             sql_password,
             "-d",
             database,
-            "-Q",
-            query,
             "-s",
             "|",  # Pipe delimited
             "-W",  # Strip trailing spaces
@@ -160,8 +546,31 @@ class BatchRunner(QObject):
             "-b",  # Exit on error
         ]
 
-        return self.run_command(cmd, timeout=timeout)
+        # -Q does not understand GO separators and is bound by the command-line
+        # length limit, so multi-batch or large scripts go through an input file
+        if "\nGO\n" not in query and len(query) < self.MAX_INLINE_QUERY:
+            return self.run_command(cmd + ["-Q", query], timeout=timeout)
 
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".sql", encoding="utf-8", delete=False
+        ) as script:
+            script.write(query)
+        try:
+            return self.run_command(
+                cmd + ["-f", "65001", "-i", script.name], timeout=timeout
+            )
+        finally:
+            os.unlink(script.name)
+
+    def close_sqlcmd(self):
+        """Shut down the persistent sqlcmd sessions"""
+        with self._sqlcmd_lock:
+            if self._sqlcmd_pool is not None:
+                self._sqlcmd_pool.close()
+            self._sqlcmd_pool = None
+            self._sqlcmd_key = None
+
+    @_operation
     def import_rms_settings(self) -> Tuple[bool, object]:
         """Import settings from RMSInfo.json"""
         import json
@@ -265,15 +674,16 @@ class BatchRunner(QObject):
         if not base_url:
             return False, "API Base URL not configured"
 
-        # Ensure base URL doesn't have trailing slash if we're adding one
-        full_url = f"{base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+        full_url = _api_base(base_url) + endpoint.lstrip("/")
 
-        self._log_output(f"[*] API Call ({method}): {full_url}")
+        # Collect the call details and emit them as one log entry
+        lines = [f"[*] API Call ({method}): {full_url}"]
         if params:
-            self._log_output(f"[*] Params: {params}")
+            lines.append(f"[*] Params: {params}")
         if json_data:
-            self._log_output(f"[*] Payload: {json_data}")
+            lines.append(f"[*] Payload: {json_data}")
 
+        error_msg = None
         try:
             # Dynamic Method Call
             # Only include json_data if it exists to avoid sending empty body/headers on GET
@@ -281,14 +691,14 @@ class BatchRunner(QObject):
             if json_data is not None:
                 req_kwargs["json"] = json_data
 
-            response = requests.request(method, full_url, **req_kwargs)
+            response = self._get_session().request(method, full_url, **req_kwargs)
 
-            self._log_output(f"    Status: {response.status_code}")
+            lines.append(f"    Status: {response.status_code}")
 
             if response.status_code == 200:
                 try:
                     resp_json = response.json()
-                    self._log_output(f"    Response: {resp_json}")
+                    lines.append(f"    Response: {resp_json}")
 
                     # Check 'IsDone' from response as per requirement
                     is_done = resp_json.get("IsDone", False)
@@ -301,18 +711,22 @@ class BatchRunner(QObject):
 
                 except Exception:
                     # Fallback for non-JSON responses (legacy) or simple 200 OK
-                    self._log_output(f"    Raw Response: {response.text}")
+                    lines.append(f"    Raw Response: {response.text}")
                     return True, "API call successful (No JSON)"
             else:
                 error_msg = f"API Failed: {response.status_code} - {response.text}"
-                self._log_output(error_msg, is_error=True)
                 return False, error_msg
 
         except Exception as e:
             error_msg = f"API Connection Error: {e}"
-            self._log_output(error_msg, is_error=True)
             return False, error_msg
 
+        finally:
+            self._log_output("\n".join(lines))
+            if error_msg:
+                self._log_output(error_msg, is_error=True)
+
+    @_operation
     def execute_uninstall_branch(self) -> OperationResult:
         """Call Uninstall Branch API"""
         result = OperationResult.create("uninstall_branch")
@@ -342,6 +756,7 @@ class BatchRunner(QObject):
 
         return result
 
+    @_operation
     def execute_uninstall_pos(self) -> OperationResult:
         """Call Uninstall POS Machine API"""
         result = OperationResult.create("uninstall_pos")
@@ -375,6 +790,7 @@ class BatchRunner(QObject):
 
         return result
 
+    @_operation
     def verify_branch_install_status(self) -> Tuple[bool, str]:
         """
         Verify if the configured Branch Code exists in the installed branches list.
@@ -390,12 +806,12 @@ class BatchRunner(QObject):
         if not base_url:
             return False, "API Base URL not configured"
 
-        full_url = f"{base_url.rstrip('/')}/api/Branch/GetInstallBranch"
+        full_url = _api_base(base_url) + "api/Branch/GetInstallBranch"
         self._log_output(f"[*] Verifying Branch: {full_url}")
 
         try:
             # Enforce detailed error capability
-            response = requests.get(
+            response = self._get_session().get(
                 full_url, timeout=15, verify=False
             )  # SSL Verify False to avoid cert issues in custom environments
             self._log_output(f"    Status: {response.status_code}")
@@ -405,14 +821,20 @@ class BatchRunner(QObject):
                     branches = response.json()
                     # Expecting a list of dicts
                     if isinstance(branches, list):
-                        for b in branches:
-                            if str(b.get("BranchCode")) == str(
-                                branch_code
-                            ):  # String comparison safety
-                                return (
-                                    True,
-                                    f"Branch {branch_code} is Installed (ID: {b.get('Id')})",
-                                )
+                        target = str(branch_code)  # String comparison safety
+                        found = next(
+                            (
+                                b
+                                for b in branches
+                                if str(b.get("BranchCode")) == target
+                            ),
+                            None,
+                        )
+                        if found is not None:
+                            return (
+                                True,
+                                f"Branch {branch_code} is Installed (ID: {found.get('Id')})",
+                            )
                         return (
                             False,
                             f"Branch {branch_code} NOT found in installed list.",
@@ -437,13 +859,13 @@ class BatchRunner(QObject):
 
     # ===== CLEANUP OPERATIONS WITH STRUCTURED RESULTS =====
 
-    def stop_service(self, service_name: str) -> Tuple[bool, str]:
-        """Stop a Windows service with timeout"""
+    async def stop_service_async(self, service_name: str) -> Tuple[bool, str]:
+        """Stop a Windows service with timeout without blocking the event loop"""
         self._log_output(f"[*] Stopping service: {service_name}")
 
         try:
-            returncode, stdout, stderr = self.run_command(
-                ["net", "stop", service_name], timeout=self.SERVICE_TIMEOUT
+            returncode, stdout, stderr = await self.run_command_async(
+                [_exe("net"), "stop", service_name], timeout=self.SERVICE_TIMEOUT
             )
 
             # Return code 0 = success, 2 = service not running
@@ -461,13 +883,13 @@ class BatchRunner(QObject):
             self._log_output(error_msg, is_error=True)
             return False, error_msg
 
-    def delete_service(self, service_name: str) -> Tuple[bool, str]:
-        """Delete a Windows service"""
+    async def delete_service_async(self, service_name: str) -> Tuple[bool, str]:
+        """Delete a Windows service without blocking the event loop"""
         self._log_output(f"[*] Deleting service: {service_name}")
 
         try:
-            returncode, stdout, stderr = self.run_command(
-                ["sc", "delete", service_name]
+            returncode, stdout, stderr = await self.run_command_async(
+                [_exe("sc"), "delete", service_name]
             )
             success = returncode == 0
             message = (
@@ -483,10 +905,11 @@ class BatchRunner(QObject):
             self._log_output(error_msg, is_error=True)
             return False, error_msg
 
+    @_operation
     def test_sql_connection(self, instance: str, user: str, password: str) -> bool:
         """Test SQL connectivity using sqlcmd"""
         cmd = [
-            "sqlcmd",
+            _exe("sqlcmd"),
             "-S",
             instance,
             "-U",
@@ -502,11 +925,12 @@ class BatchRunner(QObject):
         code, out, err = self.run_command(cmd, timeout=10)
         return code == 0
 
+    @_operation
     def fetch_databases(self, instance: str, user: str, password: str) -> List[str]:
         """Fetch list of non-system databases"""
         query = "SET NOCOUNT ON; SELECT name FROM sys.databases WHERE name NOT IN ('master', 'tempdb', 'model', 'msdb') ORDER BY name;"
         cmd = [
-            "sqlcmd",
+            _exe("sqlcmd"),
             "-S",
             instance,
             "-U",
@@ -520,35 +944,154 @@ class BatchRunner(QObject):
             "-W",  # Remove trailing whitespace
             "-b",
         ]
-        code, out, err = self.run_command(cmd, timeout=15)
-        if code == 0 and out:
-            # Parse lines, strip whitespace, ignore empty lines
-            dbs = [line.strip() for line in out.splitlines() if line.strip()]
+        dbs = []
+
+        def collect(line: str):
+            # Strip whitespace, ignore empty lines
+            name = line.strip()
+            if name:
+                dbs.append(name)
+
+        code, err = self.run_command_stream(cmd, collect, timeout=15)
+        if code == 0:
+            self._log_output(f"Found databases: {', '.join(dbs)}")
             return dbs
         return []
 
-    def drop_database(self, database_name: str) -> Tuple[bool, str]:
-        """Drop a SQL Server database"""
-        self._log_output(f"[*] Dropping database: {database_name}")
+    def drop_databases(self, database_names: List[str]) -> List[Tuple[bool, str]]:
+        """Drop several databases concurrently over the sqlcmd session pool"""
+        if not database_names:
+            return []
 
+        self._log_output(f"[*] Dropping databases: {', '.join(database_names)}")
+
+        def drop(name: str) -> Tuple[bool, str]:
+            # Each drop reports its own outcome so one failure doesn't mask the rest
+            query = f"""
+            BEGIN TRY
+                DROP DATABASE IF EXISTS [{name}];
+                PRINT 'DROP_OK';
+            END TRY
+            BEGIN CATCH
+                PRINT 'DROP_ERR:' + ERROR_MESSAGE();
+            END CATCH
+            """
+            try:
+                returncode, stdout, stderr = self.sqlcmd(query)
+            except Exception as e:
+                error_msg = f"Error dropping database {name}: {e}"
+                self._log_output(error_msg, is_error=True)
+                return False, error_msg
+
+            if "DROP_OK" in stdout.splitlines():
+                return True, f"Database {name} dropped"
+            return False, f"Failed to drop database {name}"
+
+        return self._run_parallel(drop, database_names, self.SQLCMD_POOL_SIZE)
+
+    @staticmethod
+    def _rm_onerror(func, path, exc_info):
+        """rmtree error hook: clear read-only flag and retry transient failures"""
+        for attempt in range(3):
+            try:
+                # chmod follows links, which would change the target instead
+                if not _is_link_stat(os.lstat(path)):
+                    os.chmod(path, stat.S_IWRITE)
+                func(path)
+                return
+            except FileNotFoundError:
+                return
+            except OSError:
+                # Sharing violations from AV/indexers usually clear quickly
+                time.sleep(0.1 * (attempt + 1))
+
+    def _unlink_file(self, path: str):
+        """Delete one file, clearing read-only and retrying like _rm_onerror"""
         try:
-            returncode, stdout, stderr = self.sqlcmd(
-                f"DROP DATABASE IF EXISTS [{database_name}]"
-            )
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            self._rm_onerror(os.unlink, path, None)
+
+    @staticmethod
+    def _is_link(entry: os.DirEntry) -> bool:
+        """Symlink, junction or mount point: remove the link, never its target"""
+        if entry.is_symlink():
+            return True
+        try:
+            return _is_link_stat(entry.stat(follow_symlinks=False))
+        except OSError:
+            # Unknown: treat as a link so it is never descended into; if it is
+            # a real folder, the final rmtree sweep removes it safely
+            return True
 
-            success = returncode == 0
-            message = (
-                f"Database {database_name} dropped"
-                if success
-                else f"Failed to drop database {database_name}"
-            )
+    @staticmethod
+    def _remove_link(path: str):
+        """Remove a link itself (file or directory flavour) without following it"""
+        try:
+            os.unlink(path)
+        except OSError:
+            try:
+                os.rmdir(path)
+            except OSError:
+                pass
+
+    def _parallel_rmtree(self, path: str):
+        """
+        Remove a directory tree, unlinking its files concurrently
 
-            return success, message
+        Windows completes deletes asynchronously (delete-pending), so issuing
+        many at once overlaps that latency. Like shutil.rmtree, links and
+        junctions inside the tree are removed without descending into them.
+        Never raises; callers check whether the path is gone.
+        """
+        try:
+            root = os.lstat(path)
+        except OSError:
+            return
+        if _is_link_stat(root):
+            # The folder itself is a link: drop it and leave the target alone
+            self._remove_link(path)
+            return
 
-        except Exception as e:
-            error_msg = f"Error dropping database {database_name}: {e}"
-            self._log_output(error_msg, is_error=True)
-            return False, error_msg
+        files = []
+        links = []
+        dirs = []
+        pending = [path]
+        while pending:
+            directory = pending.pop()
+            dirs.append(directory)
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if self._is_link(entry):
+                            links.append(entry.path)
+                        elif entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        else:
+                            files.append(entry.path)
+            except OSError:
+                continue
+
+        for link in links:
+            self._remove_link(link)
+        self._run_parallel(self._unlink_file, files, self.DELETE_WORKERS)
+
+        # Parents were listed before their children, so remove in reverse
+        for directory in reversed(dirs):
+            try:
+                os.rmdir(directory)
+            except OSError:
+                pass
+
+        # Sweep anything left behind (files created meanwhile, read-only dirs)
+        if os.path.lexists(path):
+            # onerror is deprecated from 3.12; the hook ignores its third argument
+            if sys.version_info >= (3, 12):
+                shutil.rmtree(path, onexc=self._rm_onerror)
+            else:
+                shutil.rmtree(path, onerror=self._rm_onerror)
 
     def delete_folder(self, folder_path: str) -> Tuple[bool, str]:
         """Delete a folder recursively"""
@@ -558,7 +1101,13 @@ class BatchRunner(QObject):
 
         try:
             self._log_output(f"[*] Deleting folder: {folder}")
-            shutil.rmtree(folder)
+
+            self._parallel_rmtree(str(folder))
+
+            if folder.exists():
+                error_msg = f"Failed to delete folder {folder}: files still in use"
+                self._log_output(error_msg, is_error=True)
+                return False, error_msg
             return True, f"Folder deleted: {folder}"
 
         except Exception as e:
@@ -570,96 +1119,185 @@ class BatchRunner(QObject):
         """Clean registry uninstall entries and RMS_ folders"""
         self._log_output("[*] Cleaning registry uninstall entries and RMS_ folders...")
 
+        if winreg is None:
+            error_msg = "Registry cleanup is only supported on Windows"
+            self._log_output(error_msg, is_error=True)
+            return False, error_msg, [error_msg]
+
         errors = []
+        access = winreg.KEY_READ | winreg.KEY_WOW64_64KEY
 
         try:
-            # PowerShell command equivalent to batch file
-            # Correct path relative to app/logic.py (this file is app/logic.py)
-            script_path = (
-                Path(__file__).parent.parent
-                / "assets"
-                / "scripts"
-                / "cleanup_registry.ps1"
-            )
+            with winreg.OpenKey(
+                winreg.HKEY_LOCAL_MACHINE, _UNINSTALL_KEY, 0, access
+            ) as key:
+                subkey_count = winreg.QueryInfoKey(key)[0]
+                names = [winreg.EnumKey(key, i) for i in range(subkey_count)]
+        except OSError as e:
+            error_msg = f"Registry cleanup failed: {e}"
+            self._log_output(error_msg, is_error=True)
+            return False, error_msg, [error_msg]
 
-            if not script_path.exists():
-                error_msg = f"Script not found: {script_path}"
+        for name in names:
+            if not name.upper().startswith("RMS_"):
+                continue
+
+            self._log_output(f"Deleting uninstall key: {name}")
+            try:
+                self._delete_registry_tree(
+                    winreg.HKEY_LOCAL_MACHINE, f"{_UNINSTALL_KEY}\\{name}"
+                )
+            except OSError as e:
+                error_msg = f"Failed to delete uninstall key {name}: {e}"
+                errors.append(error_msg)
                 self._log_output(error_msg, is_error=True)
-                return False, error_msg, [error_msg]
 
-            with open(script_path, "r") as f:
-                ps_script = f.read()
+            folder = os.path.join(r"C:\ProgramData", name)
+            if os.path.isdir(folder):
+                self._parallel_rmtree(folder)
+                if os.path.exists(folder):
+                    error_msg = f"Failed to delete folder {folder}: files still in use"
+                    errors.append(error_msg)
+                    self._log_output(error_msg, is_error=True)
+
+        success = not errors
+        message = "Registry cleanup completed" if success else "Registry cleanup failed"
+        return success, message, errors
+
+    @staticmethod
+    def _delete_registry_tree(root, path: str):
+        """Delete a registry key and all of its subkeys (64-bit view)"""
+        with winreg.OpenKey(
+            root, path, 0, winreg.KEY_READ | winreg.KEY_WOW64_64KEY
+        ) as key:
+            while True:
+                try:
+                    child = winreg.EnumKey(key, 0)
+                except OSError:  # No more subkeys
+                    break
+                BatchRunner._delete_registry_tree(root, f"{path}\\{child}")
+        winreg.DeleteKeyEx(root, path, winreg.KEY_WOW64_64KEY, 0)
+
+    def _run_parallel(
+        self, func, items: List, max_workers: Optional[int] = None
+    ) -> List:
+        """Apply func to independent items concurrently, preserving input order"""
+        if not items:
+            return []
+        workers = min(max_workers or self.MAX_PARALLEL_WORKERS, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._in_operation(func), items))
 
-            cmd = ["powershell", "-nologo", "-noprofile", "-Command", ps_script]
-            returncode, stdout, stderr = self.run_command(cmd)
+    async def _stop_and_delete_service_async(
+        self, service: str
+    ) -> Tuple[bool, Optional[bool]]:
+        """
+        Stop then delete a service
 
-            if stdout:
-                self._log_output(stdout)
-            if stderr and "ErrorAction" not in stderr:
-                errors.append(stderr)
-                self._log_output(stderr, is_error=True)
+        Returns:
+            (stopped, deleted); deleted is None if the service is not installed
+        """
+        if os.name == "nt":
+            # In-process SCM calls: no net.exe/sc.exe launch per service
+            return await asyncio.to_thread(self._stop_and_delete_service_scm, service)
+        stopped, _ = await self.stop_service_async(service)
+        deleted, _ = await self.delete_service_async(service)
+        return stopped, deleted
+
+    def _stop_and_delete_service_scm(
+        self, service: str
+    ) -> Tuple[bool, Optional[bool]]:
+        """Stop then delete a service via the SCM API; see the async wrapper"""
+        from app import winapi
+
+        self._log_output(f"[*] Stopping service: {service}")
+        try:
+            winapi.stop_service(service, self.SERVICE_TIMEOUT)
+            stopped = True
+        except OSError as e:
+            # Not installed: nothing to stop or delete
+            if getattr(e, "winerror", None) == winapi.ERROR_SERVICE_DOES_NOT_EXIST:
+                self._log_output(f"Service not installed, skipping: {service}")
+                return True, None
+            error_msg = f"Failed to stop service {service}: {e}"
+            self._log_output(error_msg, is_error=True)
+            stopped = False
 
-            success = returncode == 0
-            message = (
-                "Registry cleanup completed" if success else "Registry cleanup failed"
-            )
+        self._log_output(f"[*] Deleting service: {service}")
+        try:
+            winapi.delete_service(service)
+            deleted = True
+        except OSError as e:
+            error_msg = f"Failed to delete service {service}: {e}"
+            self._log_output(error_msg, is_error=True)
+            deleted = False
 
-            return success, message, errors
+        return stopped, deleted
 
-        except Exception as e:
-            error_msg = f"Registry cleanup failed: {e}"
-            self._log_output(error_msg, is_error=True)
-            return False, error_msg, [error_msg]
+    async def _stop_and_delete_services_async(
+        self, services: List[str]
+    ) -> List[Tuple[bool, Optional[bool]]]:
+        """Stop and delete all services concurrently, preserving input order"""
+        return await asyncio.gather(
+            *[self._stop_and_delete_service_async(service) for service in services]
+        )
 
+    @_operation
     def execute_cleanup(self) -> OperationResult:
         """Execute the complete cleanup operation with structured results"""
+        cfg = self._snapshot_config("services", "databases", "folders_to_delete")
         result = OperationResult.create("cleanup")
         result.status = OperationStatus.RUNNING
 
         self._log_output("Starting cleanup operation...")
         result.add_message("Cleanup operation started")
 
-        # Stop and delete services
-        services = self.config.get("services")
+        # Stop and delete services (independent per service, so run concurrently)
+        services = cfg.services
         service_results = []
 
-        for service in services:
-            # Stop service
-            success, message = self.stop_service(service)
-            resource = Resource(
-                type=ResourceType.SERVICE,
-                name=service,
-                additional_info={"action": "stop", "success": success},
+        outcomes = asyncio.run(self._stop_and_delete_services_async(services))
+        for service, (stopped, deleted) in zip(services, outcomes):
+            if deleted is None:
+                # Absent services are the expected state after a cleanup
+                result.add_message(f"Service not installed, skipped: {service}")
+                service_results.append(True)
+                continue
+
+            result.add_resource(
+                Resource(
+                    type=ResourceType.SERVICE,
+                    name=service,
+                    additional_info={"action": "stop", "success": stopped},
+                )
             )
-            result.add_resource(resource)
 
-            if success:
+            if stopped:
                 result.add_message(f"Service stopped: {service}")
             else:
                 result.add_warning(f"Failed to stop service: {service}")
 
-            # Delete service
-            success, message = self.delete_service(service)
-            resource = Resource(
-                type=ResourceType.SERVICE,
-                name=service,
-                additional_info={"action": "delete", "success": success},
+            result.add_resource(
+                Resource(
+                    type=ResourceType.SERVICE,
+                    name=service,
+                    additional_info={"action": "delete", "success": deleted},
+                )
             )
-            result.add_resource(resource)
 
-            if success:
+            if deleted:
                 result.add_message(f"Service deleted: {service}")
             else:
                 result.add_error(f"Failed to delete service: {service}")
 
-            service_results.append(success)
+            service_results.append(deleted)
 
         # Drop databases
-        databases = self.config.get("databases")
+        databases = cfg.databases
         db_results = []
 
-        for db in databases:
-            success, message = self.drop_database(db)
+        outcomes = self.drop_databases(databases)
+        for db, (success, message) in zip(databases, outcomes):
             resource = Resource(
                 type=ResourceType.DATABASE,
                 name=db,
@@ -675,11 +1313,11 @@ class BatchRunner(QObject):
             db_results.append(success)
 
         # Delete folders
-        folders = self.config.get("folders_to_delete")
+        folders = cfg.folders_to_delete
         folder_results = []
 
-        for folder in folders:
-            success, message = self.delete_folder(folder)
+        outcomes = self._run_parallel(self.delete_folder, folders)
+        for folder, (success, message) in zip(folders, outcomes):
             resource = Resource(
                 type=ResourceType.FOLDER,
                 name=folder,
@@ -725,6 +1363,7 @@ class BatchRunner(QObject):
 
     # ===== RESTORE OPERATIONS WITH STRUCTURED RESULTS =====
 
+    @_operation
     def execute_restore(
         self,
         backup_file: str,
@@ -742,13 +1381,22 @@ class BatchRunner(QObject):
         result.add_message(f"Restoring {target_db} from {backup_file}")
 
         # Validate backup file exists
-        if not Path(backup_file).exists():
+        if not os.path.isfile(backup_file):
             result.add_error(f"Backup file not found: {backup_file}")
             result.finalize(OperationStatus.FAILED)
             return result
 
-        # Get SQL paths (Defaults or Overrides)
-        default_data, default_log = self.get_sql_paths()
+        # Default SQL paths are only needed when an override is missing. The
+        # lookup and RESTORE FILELISTONLY are independent, so run them together.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            filelist_future = executor.submit(
+                self._in_operation(self.get_backup_filelist), backup_file
+            )
+            if mdf_path and ldf_path:
+                default_data, default_log = "", ""
+            else:
+                default_data, default_log = self.get_sql_paths()
+            logical_data, logical_log = filelist_future.result()
 
         # Use provided paths if available, otherwise default
         final_mdf_dir = mdf_path if mdf_path else default_data
@@ -763,8 +1411,7 @@ class BatchRunner(QObject):
         self._log_output(f"Target MDF Path: {final_mdf_dir}")
         self._log_output(f"Target LDF Path: {final_ldf_dir}")
 
-        # Get logical file names
-        logical_data, logical_log = self.get_backup_filelist(backup_file)
+        # Check logical file names
         if not logical_data or not logical_log:
             error_msg = f"Could not read logical files from backup: '{backup_file}'. Verify file integrity and SQL permissions."
             result.add_error(error_msg)
@@ -776,40 +1423,48 @@ class BatchRunner(QObject):
         target_mdf = f"{final_mdf_dir}{target_db}.mdf"
         target_ldf = f"{final_ldf_dir}{target_db}_log.ldf"
 
-        # Escape paths for SQL
-        escaped_backup = backup_file.replace("'", "''")
+        # Escape literals and identifiers for the combined script
         escaped_mdf = target_mdf.replace("'", "''")
         escaped_ldf = target_ldf.replace("'", "''")
+        escaped_data = logical_data.replace("'", "''")
+        escaped_log = logical_log.replace("'", "''")
+        db_literal = target_db.replace("'", "''")
+        db_ident = target_db.replace("]", "]]")
 
-        # Drop existing database if it exists
+        # Drop existing database if it exists. The drop reports failure via
+        # PRINT so the restore batch still runs and decides the return code.
         drop_query = f"""
-        IF DB_ID(N'{target_db}') IS NOT NULL
-        BEGIN
-            PRINT 'Dropping existing [{target_db}]...';
-            ALTER DATABASE [{target_db}] SET SINGLE_USER WITH ROLLBACK IMMEDIATE;
-            DROP DATABASE [{target_db}];
-        END;
+        BEGIN TRY
+            IF DB_ID(N'{db_literal}') IS NOT NULL
+            BEGIN
+                PRINT 'Dropping existing [{db_literal}]...';
+                ALTER DATABASE [{db_ident}] SET SINGLE_USER WITH ROLLBACK IMMEDIATE;
+                DROP DATABASE [{db_ident}];
+            END;
+        END TRY
+        BEGIN CATCH
+            PRINT 'DROP_FAILED: ' + ERROR_MESSAGE();
+        END CATCH
         """
 
-        returncode, stdout, stderr = self.sqlcmd(drop_query)
-        if returncode != 0:
-            warning_msg = "Failed to drop existing database (may not exist)"
-            result.add_warning(warning_msg)
-            self._log_output(f"[WARN] {warning_msg}", is_error=False)
-
-        # Restore database
+        # Restore database (all files of a striped backup)
         restore_query = f"""
         PRINT 'RESTORE starting...';
-        RESTORE DATABASE [{target_db}]
-          FROM DISK = N'{escaped_backup}'
-          WITH MOVE N'{logical_data}' TO N'{escaped_mdf}',
-               MOVE N'{logical_log}'  TO N'{escaped_ldf}',
+        RESTORE DATABASE [{db_ident}]
+          FROM {_disk_clause(_stripe_set(backup_file))}
+          WITH MOVE N'{escaped_data}' TO N'{escaped_mdf}',
+               MOVE N'{escaped_log}'  TO N'{escaped_ldf}',
                REPLACE, RECOVERY, STATS = 5;
         PRINT 'RESTORE complete.';
         """
 
         self._log_output(f"Restoring to [{target_db}] ...")
-        returncode, stdout, stderr = self.sqlcmd(restore_query)
+        returncode, stdout, stderr = self.sqlcmd_batch([drop_query, restore_query])
+
+        if "DROP_FAILED:" in stdout:
+            warning_msg = "Failed to drop existing database (may not exist)"
+            result.add_warning(warning_msg)
+            self._log_output(f"[WARN] {warning_msg}", is_error=False)
 
         if returncode == 0:
             success_msg = "Database restore successful"
@@ -843,42 +1498,72 @@ class BatchRunner(QObject):
 
     # ===== BACKUP OPERATIONS WITH STRUCTURED RESULTS =====
 
+    @_operation
     def execute_backup(
         self, selected_dbs: List[str] = None, selected_appsettings: List[str] = None
     ) -> OperationResult:
         """Execute shrink and backup operation with structured results"""
+        cfg = self._snapshot_config(
+            "databases",
+            "appsettings_files",
+            "backup_folder",
+            "client_name",
+            "branch_code",
+            "pos_number",
+            "backup_stripes",
+            "zip_bak_files",
+            *self.BACKUP_KEYS,
+        )
         result = OperationResult.create("backup")
         result.status = OperationStatus.RUNNING
-        timestamp = datetime.now().strftime("%d-%m-%Y_%I-%M-%S-%p")
+        # One clock read names both the appsettings copies and the archive
+        started_at = datetime.now()
+        timestamp = started_at.strftime("%d-%m-%Y_%I-%M-%S-%p")
+        new_timestamp = started_at.strftime("%Y-%m-%d_%H-%M-%S")
 
         # Use defaults if not provided (Full Backup behavior)
         if selected_dbs is None:
-            selected_dbs = self.config.get("databases")
+            selected_dbs = cfg.databases
         if selected_appsettings is None:
             # Match existing logic: backup all configured appsettings files
-            all_settings = self.config.get("appsettings_files")
-            selected_appsettings = [item["name"] for item in all_settings]
+            selected_appsettings = [item["name"] for item in cfg.appsettings_files]
+        # Only used for membership tests; databases keep their list order
+        selected_appsettings = frozenset(selected_appsettings)
+
+        # Validation: Branch Code and POS Number are mandatory for the new naming
+        # convention. Checked up front so a misconfigured POS fails before any
+        # database work rather than at zip time.
+        if not cfg.branch_code:
+            result.add_error(
+                "Invalid Configuration: Branch Code is required for backup."
+            )
+            result.finalize(OperationStatus.FAILED)
+            return result
 
-        # 0. Validate SQL Connection FIRST
-        instance = self.config.get("sql_instance")
-        user = self.config.get("sql_user")
-        password = self.config.get("sql_password")
+        if not cfg.pos_number:
+            result.add_error(
+                "Invalid Configuration: POS Number is required for backup."
+            )
+            result.finalize(OperationStatus.FAILED)
+            return result
 
-        if not self.test_sql_connection(instance, user, password):
+        # 0. Validate SQL Connection FIRST
+        # Probing through the session pool leaves a logged-in session ready for
+        # the first database instead of paying for a throwaway sqlcmd login
+        if self.sqlcmd("SELECT 1", timeout=10)[0] != 0:
             result.add_error("SQL Connection Failed. check credentials.")
             result.finalize(OperationStatus.FAILED)
             return result
 
         # Ensure absolute path with resolved drive root
-        raw_path = self.config.get("backup_folder")
+        raw_path = cfg.backup_folder
         # Fix: drive-relative paths like "C:" + "Folder" become "C:Folder"
         # We must ensure we start from root
-        if len(Path(raw_path).parts) > 0 and ":" in Path(raw_path).parts[0]:
+        drive, rest = os.path.splitdrive(raw_path)
+        if drive and not rest.startswith(("\\", "/")):
             # It's a windows path, ensure separator
-            if not raw_path.endswith(os.sep):
-                raw_backup_folder = Path(raw_path).resolve()
-        else:
-            raw_backup_folder = Path(raw_path).resolve()
+            raw_path = drive + os.sep + rest
+        raw_backup_folder = Path(raw_path).resolve()
 
         # FIX: SQL Server cannot write to User Profile (OneDrive, etc).
         # If path is in Users, fallback to C:\DB Backups
@@ -905,7 +1590,9 @@ class BatchRunner(QObject):
             backup_folder.mkdir(parents=True, exist_ok=True)
 
             if temp_dir.exists():
-                shutil.rmtree(temp_dir)
+                self._parallel_rmtree(str(temp_dir))
+                if temp_dir.exists():
+                    raise OSError(f"Could not clear stale files in {temp_dir}")
             temp_dir.mkdir(parents=True, exist_ok=True)
             self._log_output("[*] Created temporary backup directory")
             result.add_message(f"Backup directory: {temp_dir}")
@@ -922,29 +1609,28 @@ class BatchRunner(QObject):
         if not selected_dbs:
             result.add_warning("No databases selected for backup.")
 
-        for db in selected_dbs:
-            self._log_output(f"[*] Processing Database: {db}")
+        stripes = max(1, int(cfg.backup_stripes or 1))
+        options = self._backup_options(cfg)
 
-            # A. Shrink (Best Effort)
-            self._log_output("    - Shrinking...")
-            shrink_success = self.shrink_database(db)
-            if shrink_success:
+        # Databases are independent, so each runs its own pipeline on a pooled
+        # sqlcmd session; results are reported in the requested order
+        pipelines = self._run_parallel(
+            lambda db: self._shrink_and_backup(db, temp_dir, stripes, options),
+            selected_dbs,
+            self.SQLCMD_POOL_SIZE,
+        )
+
+        for db, (shrink_success, backup_path, size_bytes) in zip(
+            selected_dbs, pipelines
+        ):
+            if shrink_success is None:
+                result.add_message(f"    - Shrink skipped (no free space): {db}")
+            elif shrink_success:
                 result.add_message(f"    - Shrunk: {db}")
             else:
                 result.add_warning(f"    - Shrink failed: {db}")
 
-            # B. Backup (Critical)
-            # User Request: inner .bak file should have the same name as the DB
-            backup_path = temp_dir / f"{db}.bak"
-            self._log_output(f"    - Backing up to: {backup_path.name}")
-            backup_success = self.backup_database(db, str(backup_path))
-
-            # C. Verify File Existence & Size
-            file_verified = backup_path.exists() and backup_path.stat().st_size > 0
-
-            if backup_success and file_verified:
-                size_mb = backup_path.stat().st_size / (1024 * 1024)
-                self._log_output(f"    - SUCCESS: {db} ({size_mb:.2f} MB)")
+            if size_bytes:
                 valid_bak_files.append(backup_path)
                 backup_results.append(True)
 
@@ -953,30 +1639,36 @@ class BatchRunner(QObject):
                         type=ResourceType.DATABASE,
                         name=db,
                         path=str(backup_path),
-                        additional_info={"size_bytes": backup_path.stat().st_size},
+                        additional_info={"size_bytes": size_bytes},
                     )
                 )
             else:
-                self._log_output(f"    - FAILED: {db}", is_error=True)
                 result.add_error(f"Backup failed for {db}")
                 backup_results.append(False)
 
         # 4. AppSettings Operations: Copy
         self._log_output("[*] Processing AppSettings...")
-        appsettings = self.config.get("appsettings_files")
+        appsettings = cfg.appsettings_files
         appsettings_results = []
 
         # Only process selected AppSettings
         if not selected_appsettings:
             result.add_warning("No AppSettings selected for backup.")
 
-        for item in appsettings:
-            if item["name"] not in selected_appsettings:
-                continue
-
-            copy_success = self.copy_appsettings(
+        # Copies are independent IO, so run them side by side
+        items = (
+            [item for item in appsettings if item["name"] in selected_appsettings]
+            if selected_appsettings
+            else []
+        )
+        copy_results = self._run_parallel(
+            lambda item: self.copy_appsettings(
                 item["path"], item["name"], timestamp, str(temp_dir)
-            )
+            ),
+            items,
+        )
+
+        for item, copy_success in zip(items, copy_results):
             if copy_success:
                 appsettings_results.append(True)
                 result.add_message(f"    - Copied: {item['name']}")
@@ -986,24 +1678,9 @@ class BatchRunner(QObject):
 
         # 5. Zip Creation (Only if we have content)
         # 5. Zip Creation (Only if we have content)
-        client_name = self.config.get("client_name", "UPC")
-        branch_code = self.config.get("branch_code", "")
-        pos_number = self.config.get("pos_number", "")
-
-        # Validation: Branch Code and POS Number are mandatory for the new naming convention
-        if not branch_code:
-            result.add_error(
-                "Invalid Configuration: Branch Code is required for backup."
-            )
-            result.finalize(OperationStatus.FAILED)
-            return result
-
-        if not pos_number:
-            result.add_error(
-                "Invalid Configuration: POS Number is required for backup."
-            )
-            result.finalize(OperationStatus.FAILED)
-            return result
+        client_name = cfg.client_name
+        branch_code = cfg.branch_code
+        pos_number = cfg.pos_number
 
         # New Format: <clientName>_<BranchCode>_POS_<PosNumber>_<RmsBranchSrv>_DB_Backup_<DateTimeStamp>.zip
         # Note: <RmsBranchSrv> seems to imply the database name, but the spec says hardcoded textual logic or dynamic?
@@ -1018,8 +1695,7 @@ class BatchRunner(QObject):
         # Re-formatting timestamp to match example: 2026-01-28_14-35-12
         # Current timestamp format: %d-%m-%Y_%I-%M-%S-%p (e.g. 28-01-2026_02-35-12-PM)
         # Request Example: 2026-01-28_14-35-12 (YYYY-MM-DD_HH-MM-SS)
-
-        new_timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        # (new_timestamp is taken from the operation start time above)
 
         # New Format: <clientName>_<BranchCode>_POS_<MachineNumer>_DB_Backup_<date and time Stamp>.zip
         # Example: UPC_P001_POS_1_DB_Backup_2026-01-29_02-18-52.zip
@@ -1038,11 +1714,42 @@ class BatchRunner(QObject):
         try:
             import zipfile
 
-            with zipfile.ZipFile(zip_file, "w", zipfile.ZIP_DEFLATED) as zipf:
-                # Add all files in temp_dir
-                for file_path in temp_dir.rglob("*"):
-                    if file_path.is_file():
-                        zipf.write(file_path, file_path.relative_to(temp_dir))
+            # Every member picks its own compression below
+            with zipfile.ZipFile(zip_file, "w") as zipf:
+                # Add all files in temp_dir (staging is flat, no recursion needed)
+                with os.scandir(temp_dir) as it:
+                    entries = [(e.path, e.name) for e in it if e.is_file()]
+
+                for file_path, arcname in entries:
+                    if arcname.endswith(".bak") and cfg.zip_bak_files is False:
+                        # Same volume as Temp, so this is a rename, not a copy
+                        bak_file = zip_file.with_name(f"{zip_file.stem}_{arcname}")
+                        os.replace(file_path, bak_file)
+                        self._log_output(f"  - Moved: {arcname} → {bak_file.name}")
+                        result.add_resource(
+                            Resource(
+                                type=ResourceType.FILE,
+                                name=bak_file.name,
+                                path=str(bak_file),
+                            )
+                        )
+                    elif arcname.endswith(".bak"):
+                        # Native backups are already compressed: stream them in
+                        # as-is, then free the disk space right away
+                        self._zip_store_file(zipf, file_path, arcname)
+                        os.unlink(file_path)
+                    elif arcname.lower().endswith(self.TEXT_SUFFIXES):
+                        # Small text configs: best ratio costs next to nothing
+                        zipf.write(
+                            file_path,
+                            arcname,
+                            compress_type=zipfile.ZIP_DEFLATED,
+                            compresslevel=9,
+                        )
+                    else:
+                        zipf.write(
+                            file_path, arcname, compress_type=zipfile.ZIP_STORED
+                        )
 
             # Verify Zip
             if zip_file.exists() and zip_file.stat().st_size > 0:
@@ -1063,11 +1770,8 @@ class BatchRunner(QObject):
             self._log_output(error_msg, is_error=True)
             result.add_error(error_msg)
 
-        # 6. Cleanup
-        try:
-            shutil.rmtree(temp_dir)
-        except Exception:
-            pass  # Non-critical
+        # 6. Cleanup (non-critical; never raises)
+        self._parallel_rmtree(str(temp_dir))
 
         # 7. Final Status Determination
         # Success = Zip exists AND All requested DBs backed up
@@ -1077,7 +1781,12 @@ class BatchRunner(QObject):
             result.finalize(OperationStatus.SUCCESS)
             if os.name == "nt":
                 try:
-                    os.startfile(backup_folder)
+                    # Highlight the new archive; detached so we never wait on it
+                    subprocess.Popen(
+                        ["explorer", "/select,", str(zip_file)],
+                        creationflags=subprocess.DETACHED_PROCESS
+                        | subprocess.CREATE_NEW_PROCESS_GROUP,
+                    )
                 except Exception:
                     pass
         elif zip_success:
@@ -1094,24 +1803,28 @@ class BatchRunner(QObject):
 
     def get_backup_files(self, directory: str) -> List[Dict[str, str]]:
         """Get list of .bak files in directory"""
-        backup_dir = Path(directory)
-        if not backup_dir.exists():
+        # DirEntry.stat() reuses the directory listing data on Windows
+        try:
+            with os.scandir(directory) as entries:
+                return [
+                    {
+                        "path": entry.path,
+                        "name": entry.name,
+                        "size": entry.stat().st_size,
+                    }
+                    for entry in entries
+                    if entry.name.lower().endswith(".bak") and entry.is_file()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
             return []
 
-        files = []
-        for bak_file in backup_dir.glob("*.bak"):
-            files.append(
-                {
-                    "path": str(bak_file),
-                    "name": bak_file.name,
-                    "size": bak_file.stat().st_size,
-                }
-            )
-
-        return files
-
     def get_sql_paths(self) -> Tuple[str, str]:
-        """Get default SQL Server DATA and LOG paths"""
+        """Get default SQL Server DATA and LOG paths (cached per instance)"""
+        instance = self._sql_credentials()[0]
+        cached = self._sql_paths_cache.get(instance)
+        if cached is not None:
+            return cached
+
         query = """
         SET NOCOUNT ON;
         DECLARE @d nvarchar(260)=CAST(SERVERPROPERTY('InstanceDefaultDataPath') as nvarchar(260));
@@ -1130,65 +1843,195 @@ class BatchRunner(QObject):
         if returncode != 0 or not stdout:
             return "", ""
 
-        # Parse output
-        lines = stdout.strip().split("\n")
-        for line in lines:
-            if "|" in line:
-                data_path, log_path = line.split("|")
-                return data_path.strip(), log_path.strip()
+        # Parse output: first delimited row wins
+        for line in stdout.splitlines():
+            data_path, sep, log_path = line.partition("|")
+            if sep:
+                # Only successful lookups are cached; failures retry next time
+                paths = (data_path.strip(), log_path.strip())
+                self._sql_paths_cache[instance] = paths
+                return paths
 
         return "", ""
 
     def get_backup_filelist(self, backup_path: str) -> Tuple[str, str]:
         """Get logical file names from backup"""
-        # Escape single quotes for T-SQL
-        escaped_path = backup_path.replace("'", "''")
-
-        query = f"SET NOCOUNT ON; RESTORE FILELISTONLY FROM DISK = N'{escaped_path}';"
-        returncode, stdout, stderr = self.sqlcmd(query)
-
-        if returncode != 0:
-            self._log_output(
-                f"RESTORE FILELISTONLY failed for {backup_path}: {stderr}",
-                is_error=True,
+        return self.get_backup_filelists([backup_path])[backup_path]
+
+    def get_backup_filelists(
+        self, backup_paths: List[str]
+    ) -> Dict[str, Tuple[str, str]]:
+        """Get logical (data, log) file names for several backups in one round trip"""
+        if not backup_paths:
+            return {}
+
+        # One GO batch per backup so a bad file doesn't abort the others; the
+        # PRINT marker splits the combined output back into per-backup blocks
+        statements = []
+        for index, backup_path in enumerate(backup_paths):
+            # A striped backup can only be read with all of its files
+            devices = _disk_clause(_stripe_set(backup_path))
+            statements.append(
+                f"SET NOCOUNT ON; PRINT '---{index}---'; "
+                f"RESTORE FILELISTONLY FROM {devices};"
             )
-            return "", ""
+        returncode, stdout, stderr = self.sqlcmd_batch(statements)
+
+        blocks: Dict[int, List[str]] = {}
+        current = None
+        for line in stdout.splitlines():
+            if line.startswith("---") and line.endswith("---"):
+                current = blocks.setdefault(int(line.strip("-")), [])
+            elif current is not None:
+                current.append(line)
+
+        filelists = {}
+        for index, backup_path in enumerate(backup_paths):
+            logical_data, logical_log = self._parse_filelist(blocks.get(index, []))
+            if not logical_data or not logical_log:
+                self._log_output(
+                    f"RESTORE FILELISTONLY failed for {backup_path}: {stderr}",
+                    is_error=True,
+                )
+            filelists[backup_path] = (logical_data, logical_log)
+        return filelists
 
+    @staticmethod
+    def _parse_filelist(lines: List[str]) -> Tuple[str, str]:
+        """Pick the first data and log logical names from FILELISTONLY rows"""
         logical_data = ""
         logical_log = ""
 
-        lines = stdout.strip().split("\n")
         for line in lines:
-            if "|" in line:
-                parts = line.split("|")
-                if len(parts) >= 2:
-                    logical_name = parts[0].strip()
-                    # With -s "|" and headers off, RESTORE FILELISTONLY format can vary
-                    # but typically Column 1 is Name and Column 3 (index 2) is Type
-                    # We check field 3 for 'D' (Data) or 'L' (Log)
-                    if len(parts) >= 3:
-                        file_type = parts[2].strip()
-                        if file_type == "D" and not logical_data:
-                            logical_data = logical_name
-                        elif file_type == "L" and not logical_log:
-                            logical_log = logical_name
-
-        if not logical_data or not logical_log:
-            self._log_output(
-                f"Could not parse logical names from output: {stdout}", is_error=False
-            )
+            if "|" not in line:
+                continue
+            # With -s "|" and headers off, RESTORE FILELISTONLY format can vary
+            # but typically Column 1 is Name and Column 3 (index 2) is Type
+            # We check field 3 for 'D' (Data) or 'L' (Log)
+            parts = line.split("|", 3)
+            if len(parts) >= 3:
+                logical_name = parts[0].strip()
+                file_type = parts[2].strip()
+                if file_type == "D" and not logical_data:
+                    logical_data = logical_name
+                elif file_type == "L" and not logical_log:
+                    logical_log = logical_name
+                if logical_data and logical_log:
+                    break
 
         return logical_data, logical_log
 
+    def _shrink_and_backup(
+        self, db: str, temp_dir: Path, stripes: int = 1, options: Optional[str] = None
+    ) -> Tuple[Optional[bool], Path, int]:
+        """
+        Shrink -> Backup -> Verify one database
+
+        Returns:
+            (shrink_success, backup_path, size_bytes); shrink_success is None if
+            the shrink was skipped, size_bytes is 0 on failure
+        """
+        self._log_output(f"[*] Processing Database: {db}")
+
+        # A. Shrink (Best Effort), only when there is free space to release
+        if self._needs_shrink(db):
+            self._log_output(f"    - Shrinking: {db}")
+            shrink_success = self.shrink_database(db)
+        else:
+            self._log_output(f"    - Shrink skipped (no free space): {db}")
+            shrink_success = None
+
+        # B. Backup (Critical)
+        # User Request: inner .bak file should have the same name as the DB
+        backup_path = temp_dir / f"{db}.bak"
+        self._log_output(f"    - Backing up to: {backup_path.name}")
+        backup_success = self.backup_database(
+            db, str(backup_path), stripes, options
+        )
+
+        # C. Verify File Existence & Size (one stat per file serves both)
+        stripe_files = _stripe_paths(str(backup_path), stripes)
+        backup_path = Path(stripe_files[0])  # Report the first file of a set
+        size_bytes = 0
+        for path in stripe_files:
+            try:
+                file_size = os.stat(path).st_size
+            except FileNotFoundError:
+                file_size = 0
+            if file_size == 0:
+                size_bytes = 0
+                break
+            size_bytes += file_size
+
+        if backup_success and size_bytes > 0:
+            size_mb = size_bytes / (1024 * 1024)
+            self._log_output(f"    - SUCCESS: {db} ({size_mb:.2f} MB)")
+            return shrink_success, backup_path, size_bytes
+
+        self._log_output(f"    - FAILED: {db}", is_error=True)
+        return shrink_success, backup_path, 0
+
+    def _zip_store_file(self, zipf, file_path: str, arcname: str):
+        """Copy a file into an open archive uncompressed, in large chunks"""
+        import zipfile
+
+        zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+        zinfo.compress_type = zipfile.ZIP_STORED
+        with open(file_path, "rb", buffering=0) as src, zipf.open(
+            zinfo, "w", force_zip64=True
+        ) as dst:
+            shutil.copyfileobj(src, dst, self.COPY_BUFFER_SIZE)
+
+    def _needs_shrink(self, database_name: str) -> bool:
+        """Whether the database files hold enough free space to be worth a shrink"""
+        # size and SpaceUsed are in 8 KB pages; covers data and log files
+        query = (
+            "SET NOCOUNT ON; SELECT SUM(CAST(size - FILEPROPERTY(name, 'SpaceUsed')"
+            " AS bigint)) * 8 / 1024 FROM sys.database_files;"
+        )
+        returncode, stdout, stderr = self.sqlcmd(query, database=database_name)
+        if returncode == 0:
+            for line in stdout.splitlines():
+                line = line.strip()
+                if line.isdigit():
+                    return int(line) >= self.SHRINK_MIN_FREE_MB
+        # Unknown: fall back to shrinking as before
+        return True
+
     def shrink_database(self, database_name: str) -> bool:
         """Shrink a database using DBCC SHRINKDATABASE"""
         query = f"DBCC SHRINKDATABASE (N'{database_name}', TRUNCATEONLY)"
         returncode, stdout, stderr = self.sqlcmd(query)
         return returncode == 0
 
-    def backup_database(self, database_name: str, backup_path: str) -> bool:
-        """Backup a database to specified path"""
-        query = f"BACKUP DATABASE [{database_name}] TO DISK = '{backup_path}' WITH COMPRESSION"
+    def _backup_options(self, cfg: SimpleNamespace) -> str:
+        """BACKUP ... WITH options from a settings snapshot"""
+        options = "COMPRESSION, CHECKSUM"
+        if cfg.backup_tuning is not False:
+            # 4 MB transfers x 16 buffers = 64 MB per backup, which stays modest
+            # with the pool running several backups at once
+            max_transfer = int(
+                cfg.backup_max_transfer_size or self.BACKUP_MAX_TRANSFER_SIZE
+            )
+            buffer_count = int(cfg.backup_buffer_count or self.BACKUP_BUFFER_COUNT)
+            options += (
+                f", MAXTRANSFERSIZE = {max_transfer}, BUFFERCOUNT = {buffer_count}"
+            )
+        return options
+
+    def backup_database(
+        self,
+        database_name: str,
+        backup_path: str,
+        stripes: int = 1,
+        options: Optional[str] = None,
+    ) -> bool:
+        """Backup a database to specified path, optionally striped over N files"""
+        if options is None:
+            options = self._backup_options(self._snapshot_config(*self.BACKUP_KEYS))
+        # Each stripe gets its own writer thread on the server
+        devices = _disk_clause(_stripe_paths(backup_path, stripes))
+        query = f"BACKUP DATABASE [{database_name}] TO {devices} WITH {options}"
         returncode, stdout, stderr = self.sqlcmd(query)
         return returncode == 0
 
@@ -1196,33 +2039,57 @@ class BatchRunner(QObject):
         self, source_path: str, target_name: str, timestamp: str, temp_dir: str
     ) -> bool:
         """Copy and timestamp appsettings file"""
-        source = Path(source_path)
-        if not source.exists():
+        if not os.path.isfile(source_path):
             self._log_output(f"File not found: {source_path}")
             return False
 
         # Create target filename with timestamp
-        target_stem = Path(target_name).stem
-        target_ext = Path(target_name).suffix
+        target_stem, target_ext = os.path.splitext(os.path.basename(target_name))
         target_filename = f"{target_stem}_{timestamp}{target_ext}"
-        target_path = Path(temp_dir) / target_filename
+        target_path = os.path.join(temp_dir, target_filename)
 
         try:
-            shutil.copy2(source, target_path)
+            # A real copy, not a link: the staged file must be a snapshot that
+            # Temp cleanup can change or delete without touching the original
+            self._copy_file(source_path, target_path)
             self._log_output(f"  - Copying: {source_path} → {target_filename}")
             return True
         except Exception as e:
             self._log_output(f"Failed to copy {source_path}: {e}", is_error=True)
             return False
 
+    @staticmethod
+    def _copy_file(source_path: str, target_path: str):
+        """Copy a file with the fastest method the platform offers"""
+        if os.name == "nt":
+            from app import winapi
+
+            # Lets the OS pick the fastest copy path (e.g. server-side copy)
+            winapi.copy_file(source_path, target_path)
+        else:
+            shutil.copy2(source_path, target_path)
+
     # ===== SERVICE CONTROL =====
 
+    @_operation
     def control_service(self, service_name: str, action: str) -> bool:
         """Control Windows service (start/stop/restart)"""
         action = action.lower()
 
         if action == "restart":
             self._log_output(f"Restarting service: {service_name}...")
+            if os.name == "nt":
+                from app import winapi
+
+                # Talk to the SCM directly: no net.exe launches, no fixed pause
+                try:
+                    winapi.restart_service(service_name, self.SERVICE_TIMEOUT)
+                except OSError as e:
+                    self._log_output(f"Service restart failed: {e}", is_error=True)
+                    return False
+                self._log_output(f"Service restart successful: {service_name}")
+                return True
+
             stop_ok = self.control_service(service_name, "stop")
             time.sleep(2)  # Brief pause
             start_ok = self.control_service(service_name, "start")
@@ -1230,9 +2097,9 @@ class BatchRunner(QObject):
 
         cmd = []
         if action == "start":
-            cmd = ["net", "start", service_name]
+            cmd = [_exe("net"), "start", service_name]
         elif action == "stop":
-            cmd = ["net", "stop", service_name]
+            cmd = [_exe("net"), "stop", service_name]
         else:
             return False
 
@@ -22,7 +22,6 @@ if os.name == "nt":
     ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
 
 from PySide6.QtWidgets import QApplication
-from app.admin import AdminManager
 from app.ui import MainWindow
 from app.logger import setup_logger
 
@@ -33,16 +32,7 @@ def main():
     logger = setup_logger()
     logger.info("Starting POS Admin Tool")
 
-    # Check and request admin privileges
-    admin_manager = AdminManager()
-    if not admin_manager.is_admin():
-        logger.info("Requesting administrator privileges...")
-        if admin_manager.request_admin():
-            logger.info("Restarting with admin privileges")
-            sys.exit(0)
-        else:
-            logger.error("Admin privileges required but not granted")
-            return 1
+    # Admin privileges are requested on the first privileged operation
 
     # Create application
     app = QApplication(sys.argv)
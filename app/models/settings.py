@@ -61,6 +61,16 @@ class AppSettings:
 
     # Backup configuration
     backup_folder: str = r"D:\DB Backups"
+    # Larger BACKUP transfer buffers; disable on low-memory machines
+    backup_tuning: bool = True
+    # Overrides for the tuned values (0 = built-in default); MAXTRANSFERSIZE
+    # must be a multiple of 64 KB up to 4 MB
+    backup_max_transfer_size: int = 0
+    backup_buffer_count: int = 0
+    # Files per database backup; >1 writes a stripe set (name_1of4.bak, ...)
+    backup_stripes: int = 1
+    # False: move .bak files next to the archive instead of copying them into it
+    zip_bak_files: bool = True
 
     # AppSettings files
     appsettings_files: List[Dict[str, str]] = field(
@@ -0,0 +1,208 @@
+"""
+Persistent sqlcmd processes that run many queries over a single login
+"""
+
+import queue
+import re
+import subprocess
+import threading
+import time
+import uuid
+from typing import List, Tuple
+
+# Interactive sqlcmd echoes "1> 2> " line prompts when reading from a pipe
+_SQLCMD_PROMPT_RE = re.compile(r"^(?:\d+> )+")
+# Server error header, e.g. "Msg 3701, Level 11, State 1, Server X, Line 1"
+_SQLCMD_ERROR_RE = re.compile(r"^Msg \d+, Level (\d+),")
+
+
+class SqlcmdSession:
+    """A single interactive sqlcmd process fed queries over stdin"""
+
+    def __init__(
+        self, instance: str, user: str, password: str, executable: str = "sqlcmd"
+    ):
+        cmd = [
+            executable,
+            "-S",
+            instance,
+            "-U",
+            user,
+            "-P",
+            password,
+            "-s",
+            "|",  # Pipe delimited
+            "-W",  # Strip trailing spaces
+            "-h",
+            "-1",  # No headers
+            "-f",
+            "65001",  # Scripts are written to stdin as UTF-8
+        ]
+        self.proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            creationflags=0x08000000,  # CREATE_NO_WINDOW
+        )
+
+        # Drain stdout on a background thread so reads can honour a timeout
+        self._lines: queue.Queue = queue.Queue()
+        threading.Thread(target=self._pump, daemon=True, name="SqlcmdReader").start()
+
+        # Session-wide setting: row count messages are never parsed
+        self.proc.stdin.write("SET NOCOUNT ON;\nGO\n")
+        self.proc.stdin.flush()
+
+    def _pump(self):
+        for line in self.proc.stdout:
+            self._lines.put(line)
+        self._lines.put(None)  # EOF
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def query(self, query: str, database: str, timeout: int) -> Tuple[int, str, str]:
+        """
+        Run one query and read its output up to an end marker
+
+        Raises:
+            subprocess.TimeoutExpired: the query did not finish in time
+                (the session is closed, as it can no longer be trusted)
+            OSError: the script could not be written, so nothing was run
+        """
+        marker = f"__END_{uuid.uuid4().hex}__"
+        deadline = time.monotonic() + timeout
+
+        if database != "master":
+            # Switch in a batch of its own and check it: if the database is
+            # missing, the query must not silently run in master instead
+            ident = database.replace("]", "]]")
+            self._send(f"USE [{ident}];\nGO\nPRINT '{marker}'\nGO\n")
+            out_lines, err_lines = self._read_until(marker, deadline, timeout)
+            if err_lines:
+                return 1, "\n".join(out_lines), "\n".join(err_lines)
+
+        # Switch back to master afterwards: an idle session left inside a user
+        # database would block a later DROP/RESTORE of that database
+        self._send(f"{query}\nGO\nUSE [master];\nPRINT '{marker}'\nGO\n")
+        out_lines, err_lines = self._read_until(marker, deadline, timeout)
+        returncode = 1 if err_lines else 0
+        return returncode, "\n".join(out_lines), "\n".join(err_lines)
+
+    def _send(self, script: str):
+        self.proc.stdin.write(script)
+        self.proc.stdin.flush()
+
+    def _read_until(
+        self, marker: str, deadline: float, timeout: int
+    ) -> Tuple[List[str], List[str]]:
+        """Collect (output, error) lines up to the marker"""
+        out_lines: List[str] = []
+        err_lines: List[str] = []
+        in_error = False
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    raise queue.Empty
+                line = self._lines.get(timeout=remaining)
+            except queue.Empty:
+                self.close()
+                raise subprocess.TimeoutExpired("sqlcmd", timeout)
+
+            if line is None:
+                # The script was already sent, so this is a failure of the query
+                # (e.g. login failed), never something to retry elsewhere
+                err_lines.append("sqlcmd session exited unexpectedly")
+                return out_lines, err_lines
+
+            line = _SQLCMD_PROMPT_RE.sub("", line.rstrip("\r\n"))
+            if line == marker:
+                return out_lines, err_lines
+
+            match = _SQLCMD_ERROR_RE.match(line)
+            if match and int(match.group(1)) > 10:
+                err_lines.append(line)
+                in_error = True
+            elif in_error or line.startswith("Sqlcmd: Error"):
+                err_lines.append(line)
+                in_error = False
+            out_lines.append(line)
+
+    def close(self):
+        """Ask sqlcmd to exit, killing it if it does not"""
+        if not self.alive:
+            return
+        try:
+            self.proc.stdin.write("EXIT\n")
+            self.proc.stdin.flush()
+            self.proc.wait(timeout=5)
+        except Exception:
+            self.proc.kill()
+
+
+class SqlcmdPool:
+    """A bounded set of sqlcmd sessions so independent queries run concurrently"""
+
+    def __init__(
+        self,
+        instance: str,
+        user: str,
+        password: str,
+        size: int = 4,
+        executable: str = "sqlcmd",
+    ):
+        self._credentials = (instance, user, password, executable)
+        # One slot per session in use; idle sessions are parked in the queue
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle: queue.Queue = queue.Queue()
+        self._closed = False
+        # Orders re-parking a session against close() draining the queue
+        self._close_lock = threading.Lock()
+
+    def query(self, query: str, database: str, timeout: int) -> Tuple[int, str, str]:
+        """Run a query on any free session; see SqlcmdSession.query"""
+        with self._slots:
+            session = None
+            while session is None:
+                try:
+                    session = self._idle.get_nowait()
+                except queue.Empty:
+                    session = SqlcmdSession(*self._credentials)
+                    break
+                if not session.alive:
+                    # Exited while idle: writing to it would only fail
+                    session.close()
+                    session = None
+
+            try:
+                result = session.query(query, database, timeout)
+            except BaseException:
+                session.close()
+                raise
+
+            with self._close_lock:
+                parked = session.alive and not self._closed
+                if parked:
+                    self._idle.put(session)
+            if not parked:
+                # Pool was closed (or replaced) while this query ran
+                session.close()
+            return result
+
+    def close(self):
+        """Shut down all idle sessions; busy ones are closed when they finish"""
+        with self._close_lock:
+            self._closed = True
+        while True:
+            try:
+                session = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            session.close()
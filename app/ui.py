@@ -32,6 +32,7 @@ from PySide6.QtCore import Qt, QTimer, Signal, QThread, QObject, QUrl
 from PySide6.QtGui import QDesktopServices, QIcon
 from PySide6.QtGui import QStandardItemModel, QStandardItem
 
+from app.admin import ElevationRequested, is_admin, require_admin
 from app.config import ConfigManager
 from app.logic import BatchRunner
 from app.services import ServiceMonitor, ServiceStatus
@@ -277,6 +278,9 @@ class MainController(QObject):
     op_started = Signal()
     op_finished = Signal(OperationResult)
 
+    # Operations that only call the RMS API and can run unelevated
+    UNPRIVILEGED_OPERATIONS = {"uninstall_branch", "uninstall_pos"}
+
     def __init__(self):
         super().__init__()
         self.config_manager = ConfigManager()
@@ -312,6 +316,38 @@ class MainController(QObject):
 
     def shutdown(self):
         self.service_monitor.stop_monitoring()
+        self.batch_runner.close_sqlcmd()
+
+    def ensure_admin(self) -> bool:
+        """Elevate before a privileged action; quits if an elevated copy was launched"""
+        try:
+            if not is_admin():
+                # Persist in-memory settings first: the elevated copy loads
+                # them from disk as soon as it starts
+                try:
+                    self.config_manager.save()
+                except Exception as e:
+                    self.log_msg.emit(f"Failed to save config: {e}", True)
+            with require_admin():
+                return True
+        except ElevationRequested as e:
+            from app import winapi
+
+            # Nothing waits on the elevated copy; just release its handle
+            winapi.close_handle(e.process)
+            logger.info("Restarting with admin privileges")
+            QMessageBox.information(
+                None,
+                "Administrator Rights Required",
+                "POS Admin Tool is restarting with administrator rights.\n\n"
+                "Your settings were saved. Please repeat the action in the "
+                "new window.",
+            )
+            QApplication.quit()
+        except OSError as e:
+            # PermissionError (elevation refused) or a failed token check
+            self.log_msg.emit(str(e), True)
+        return False
 
     def load_config(self):
         self.settings = self.config_manager.load()
@@ -399,6 +435,8 @@ class MainController(QObject):
             self.log_msg.emit("No new services found.", True)
 
     def control_service(self, name: str, action: str):
+        if not self.ensure_admin():
+            return
         self.log_msg.emit(f"Requesting {action} for {name}...", False)
         # Run in thread to not block UI
         # But BatchRunner.control_service is synchronous?
@@ -425,6 +463,9 @@ class MainController(QObject):
             self.log_msg.emit("Operation already in progress.", True)
             return
 
+        if op_type not in self.UNPRIVILEGED_OPERATIONS and not self.ensure_admin():
+            return
+
         self.op_started.emit()
         self.worker = WorkerThread(op_type, self.batch_runner, **kwargs)
         self.worker.output_received.connect(self.log_msg)
@@ -1477,10 +1518,15 @@ class MainWindow(QMainWindow):
         self.ops_panel.load_state(settings)
 
     def append_log(self, msg: str, is_error: bool):
+        # Log lines arrive in batches; one append keeps the widget from
+        # re-laying out per line
         ts = datetime.now().strftime("%H:%M:%S")
         color = "red" if is_error else "#0F0"
         self.log_area.append(
-            f'<span style="color:gray">[{ts}]</span> <span style="color:{color}">{msg}</span>'
+            "<br>".join(
+                f'<span style="color:gray">[{ts}]</span> <span style="color:{color}">{line}</span>'
+                for line in msg.rstrip("\n").split("\n")
+            )
         )
 
     def set_busy(self, busy: bool):
@@ -0,0 +1,319 @@
+"""
+ctypes bindings for the Win32 APIs used by the admin and file helpers (Windows only)
+"""
+
+import atexit
+import ctypes
+import time
+from contextlib import contextmanager
+from ctypes import wintypes
+from typing import Optional
+
+SW_SHOWNORMAL = 1
+SEE_MASK_NOCLOSEPROCESS = 0x00000040
+SEE_MASK_NOASYNC = 0x00000100
+SEE_MASK_FLAG_NO_UI = 0x00000400
+INFINITE = 0xFFFFFFFF
+WAIT_OBJECT_0 = 0
+TOKEN_DUPLICATE = 0x0002
+TOKEN_QUERY = 0x0008
+SECURITY_IDENTIFICATION = 1
+
+# Service Control Manager access rights, controls and states
+SC_MANAGER_CONNECT = 0x0001
+SERVICE_QUERY_STATUS = 0x0004
+SERVICE_START = 0x0010
+SERVICE_STOP = 0x0020
+DELETE = 0x00010000
+SERVICE_CONTROL_STOP = 1
+SERVICE_STOPPED = 1
+SERVICE_RUNNING = 4
+ERROR_SERVICE_ALREADY_RUNNING = 1056
+ERROR_SERVICE_DOES_NOT_EXIST = 1060
+ERROR_SERVICE_NOT_ACTIVE = 1062
+
+# SID authority / RIDs for the BUILTIN\Administrators group
+SECURITY_NT_AUTHORITY = (0, 0, 0, 0, 0, 5)
+SECURITY_BUILTIN_DOMAIN_RID = 0x20
+DOMAIN_ALIAS_RID_ADMINS = 0x220
+
+
+class SID_IDENTIFIER_AUTHORITY(ctypes.Structure):
+    _fields_ = [("Value", ctypes.c_ubyte * 6)]
+
+
+class SHELLEXECUTEINFOW(ctypes.Structure):
+    _fields_ = [
+        ("cbSize", wintypes.DWORD),
+        ("fMask", wintypes.ULONG),
+        ("hwnd", wintypes.HWND),
+        ("lpVerb", wintypes.LPCWSTR),
+        ("lpFile", wintypes.LPCWSTR),
+        ("lpParameters", wintypes.LPCWSTR),
+        ("lpDirectory", wintypes.LPCWSTR),
+        ("nShow", ctypes.c_int),
+        ("hInstApp", wintypes.HINSTANCE),
+        ("lpIDList", ctypes.c_void_p),
+        ("lpClass", wintypes.LPCWSTR),
+        ("hkeyClass", wintypes.HKEY),
+        ("dwHotKey", wintypes.DWORD),
+        ("hIconOrMonitor", wintypes.HANDLE),
+        ("hProcess", wintypes.HANDLE),
+    ]
+
+
+class SERVICE_STATUS(ctypes.Structure):
+    _fields_ = [
+        ("dwServiceType", wintypes.DWORD),
+        ("dwCurrentState", wintypes.DWORD),
+        ("dwControlsAccepted", wintypes.DWORD),
+        ("dwWin32ExitCode", wintypes.DWORD),
+        ("dwServiceSpecificExitCode", wintypes.DWORD),
+        ("dwCheckPoint", wintypes.DWORD),
+        ("dwWaitHint", wintypes.DWORD),
+    ]
+
+
+# Bind Win32 entry points once so calls skip the WinDLL attribute lookup
+_shell32 = ctypes.WinDLL("shell32", use_last_error=True)
+_advapi32 = ctypes.WinDLL("advapi32", use_last_error=True)
+_kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+_AllocateAndInitializeSid = _advapi32.AllocateAndInitializeSid
+_AllocateAndInitializeSid.argtypes = [
+    ctypes.POINTER(SID_IDENTIFIER_AUTHORITY),
+    ctypes.c_ubyte,
+] + [wintypes.DWORD] * 8 + [ctypes.POINTER(ctypes.c_void_p)]
+_AllocateAndInitializeSid.restype = wintypes.BOOL
+
+_FreeSid = _advapi32.FreeSid
+_FreeSid.argtypes = [ctypes.c_void_p]
+_FreeSid.restype = ctypes.c_void_p
+
+_GetCurrentProcess = _kernel32.GetCurrentProcess
+_GetCurrentProcess.argtypes = []
+_GetCurrentProcess.restype = wintypes.HANDLE
+
+_OpenProcessToken = _advapi32.OpenProcessToken
+_OpenProcessToken.argtypes = [
+    wintypes.HANDLE,
+    wintypes.DWORD,
+    ctypes.POINTER(wintypes.HANDLE),
+]
+_OpenProcessToken.restype = wintypes.BOOL
+
+_DuplicateToken = _advapi32.DuplicateToken
+_DuplicateToken.argtypes = [
+    wintypes.HANDLE,
+    ctypes.c_int,
+    ctypes.POINTER(wintypes.HANDLE),
+]
+_DuplicateToken.restype = wintypes.BOOL
+
+_CheckTokenMembership = _advapi32.CheckTokenMembership
+_CheckTokenMembership.argtypes = [
+    wintypes.HANDLE,
+    ctypes.c_void_p,
+    ctypes.POINTER(wintypes.BOOL),
+]
+_CheckTokenMembership.restype = wintypes.BOOL
+
+_ShellExecuteExW = _shell32.ShellExecuteExW
+_ShellExecuteExW.argtypes = [ctypes.POINTER(SHELLEXECUTEINFOW)]
+_ShellExecuteExW.restype = wintypes.BOOL
+
+_WaitForSingleObject = _kernel32.WaitForSingleObject
+_WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+_WaitForSingleObject.restype = wintypes.DWORD
+
+_CloseHandle = _kernel32.CloseHandle
+_CloseHandle.argtypes = [wintypes.HANDLE]
+_CloseHandle.restype = wintypes.BOOL
+
+_OpenSCManagerW = _advapi32.OpenSCManagerW
+_OpenSCManagerW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD]
+_OpenSCManagerW.restype = wintypes.HANDLE
+
+_OpenServiceW = _advapi32.OpenServiceW
+_OpenServiceW.argtypes = [wintypes.HANDLE, wintypes.LPCWSTR, wintypes.DWORD]
+_OpenServiceW.restype = wintypes.HANDLE
+
+_CloseServiceHandle = _advapi32.CloseServiceHandle
+_CloseServiceHandle.argtypes = [wintypes.HANDLE]
+_CloseServiceHandle.restype = wintypes.BOOL
+
+_ControlService = _advapi32.ControlService
+_ControlService.argtypes = [
+    wintypes.HANDLE,
+    wintypes.DWORD,
+    ctypes.POINTER(SERVICE_STATUS),
+]
+_ControlService.restype = wintypes.BOOL
+
+_StartServiceW = _advapi32.StartServiceW
+_StartServiceW.argtypes = [wintypes.HANDLE, wintypes.DWORD, ctypes.c_void_p]
+_StartServiceW.restype = wintypes.BOOL
+
+_QueryServiceStatus = _advapi32.QueryServiceStatus
+_QueryServiceStatus.argtypes = [wintypes.HANDLE, ctypes.POINTER(SERVICE_STATUS)]
+_QueryServiceStatus.restype = wintypes.BOOL
+
+_DeleteService = _advapi32.DeleteService
+_DeleteService.argtypes = [wintypes.HANDLE]
+_DeleteService.restype = wintypes.BOOL
+
+_CopyFile2 = _kernel32.CopyFile2
+_CopyFile2.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_void_p]
+_CopyFile2.restype = ctypes.HRESULT
+
+
+def open_identification_token():
+    """Open an identification-level copy of the process token"""
+    # CheckTokenMembership needs an impersonation token, not the primary one
+    primary = wintypes.HANDLE()
+    if not _OpenProcessToken(
+        _GetCurrentProcess(), TOKEN_DUPLICATE | TOKEN_QUERY, ctypes.byref(primary)
+    ):
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        token = wintypes.HANDLE()
+        if not _DuplicateToken(primary, SECURITY_IDENTIFICATION, ctypes.byref(token)):
+            raise ctypes.WinError(ctypes.get_last_error())
+    finally:
+        _CloseHandle(primary)
+    atexit.register(_CloseHandle, token)
+    return token
+
+
+def allocate_admin_sid() -> ctypes.c_void_p:
+    """Allocate the BUILTIN\\Administrators SID"""
+    sid = ctypes.c_void_p()
+    authority = SID_IDENTIFIER_AUTHORITY((ctypes.c_ubyte * 6)(*SECURITY_NT_AUTHORITY))
+    if not _AllocateAndInitializeSid(
+        ctypes.byref(authority),
+        2,
+        SECURITY_BUILTIN_DOMAIN_RID,
+        DOMAIN_ALIAS_RID_ADMINS,
+        0,
+        0,
+        0,
+        0,
+        0,
+        0,
+        ctypes.byref(sid),
+    ):
+        raise ctypes.WinError(ctypes.get_last_error())
+    atexit.register(_FreeSid, sid)
+    return sid
+
+
+def check_token_membership(token, sid) -> bool:
+    """Check whether the token is a member of the group identified by sid"""
+    is_member = wintypes.BOOL()
+    if not _CheckTokenMembership(token, sid, ctypes.byref(is_member)):
+        raise ctypes.WinError(ctypes.get_last_error())
+    return bool(is_member.value)
+
+
+def close_handle(handle):
+    """Close a kernel object handle"""
+    _CloseHandle(handle)
+
+
+def wait_for_handle(handle, timeout_ms: int = INFINITE) -> bool:
+    """Wait for a process handle to be signalled; True if it exited in time"""
+    return _WaitForSingleObject(handle, timeout_ms) == WAIT_OBJECT_0
+
+
+def relaunch_elevated(exe_path: str, params: str, cwd: Optional[str]):
+    """Relaunch through the UAC broker and return the child process handle"""
+    info = SHELLEXECUTEINFOW()
+    info.cbSize = ctypes.sizeof(info)
+    info.fMask = SEE_MASK_NOCLOSEPROCESS | SEE_MASK_NOASYNC | SEE_MASK_FLAG_NO_UI
+    info.lpVerb = "runas"
+    info.lpFile = exe_path
+    info.lpParameters = params
+    info.lpDirectory = cwd
+    info.nShow = SW_SHOWNORMAL
+
+    if not _ShellExecuteExW(ctypes.byref(info)):
+        raise ctypes.WinError(ctypes.get_last_error())
+    return info.hProcess
+
+
+def copy_file(source: str, target: str):
+    """Copy a file (data, attributes and timestamps) with CopyFile2"""
+    # ctypes raises OSError itself when the HRESULT is a failure code
+    _CopyFile2(source, target, None)
+
+
+@contextmanager
+def _open_service(name: str, access: int):
+    """Open a service handle through the Service Control Manager"""
+    scm = _OpenSCManagerW(None, None, SC_MANAGER_CONNECT)
+    if not scm:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        service = _OpenServiceW(scm, name, access)
+        if not service:
+            raise ctypes.WinError(ctypes.get_last_error())
+        try:
+            yield service
+        finally:
+            _CloseServiceHandle(service)
+    finally:
+        _CloseServiceHandle(scm)
+
+
+def _wait_for_service_state(service, state: int, timeout: float):
+    """Poll the service status until it reaches state"""
+    status = SERVICE_STATUS()
+    deadline = time.monotonic() + timeout
+    while True:
+        if not _QueryServiceStatus(service, ctypes.byref(status)):
+            raise ctypes.WinError(ctypes.get_last_error())
+        if status.dwCurrentState == state:
+            return
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"Service did not reach state {state} in {timeout}s")
+        time.sleep(0.1)
+
+
+def _stop(service, timeout: float):
+    """Send a stop control (tolerating an already stopped service) and wait"""
+    status = SERVICE_STATUS()
+    if not _ControlService(service, SERVICE_CONTROL_STOP, ctypes.byref(status)):
+        error = ctypes.get_last_error()
+        if error != ERROR_SERVICE_NOT_ACTIVE:
+            raise ctypes.WinError(error)
+    _wait_for_service_state(service, SERVICE_STOPPED, timeout)
+
+
+def _start(service, timeout: float):
+    """Start a service (tolerating an already running one) and wait"""
+    if not _StartServiceW(service, 0, None):
+        error = ctypes.get_last_error()
+        if error != ERROR_SERVICE_ALREADY_RUNNING:
+            raise ctypes.WinError(error)
+    _wait_for_service_state(service, SERVICE_RUNNING, timeout)
+
+
+def stop_service(name: str, timeout: float):
+    """Stop a service and wait until it has stopped"""
+    with _open_service(name, SERVICE_STOP | SERVICE_QUERY_STATUS) as service:
+        _stop(service, timeout)
+
+
+def delete_service(name: str):
+    """Mark a service for deletion (removed once all handles are closed)"""
+    with _open_service(name, DELETE) as service:
+        if not _DeleteService(service):
+            raise ctypes.WinError(ctypes.get_last_error())
+
+
+def restart_service(name: str, timeout: float):
+    """Stop then start a service, waiting for each transition to finish"""
+    access = SERVICE_STOP | SERVICE_START | SERVICE_QUERY_STATUS
+    with _open_service(name, access) as service:
+        _stop(service, timeout)
+        _start(service, timeout)